@@ -5,45 +5,151 @@ Creates and configures the Flask app with all necessary extensions and blueprint
 import logging
 import os
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from flask import Flask, jsonify, request
+import atexit
+from functools import lru_cache
+from logging.handlers import MemoryHandler, RotatingFileHandler
+from flask import Flask, jsonify, request, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import NotFound
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from backend.config import get_config
 from backend.utils.error_handler import register_error_handlers
 
+# Frontend directory resolved once at import time rather than per request
+FRONTEND_DIR = Path(__file__).resolve().parent.parent / 'frontend'
+
+
+@lru_cache(maxsize=1)
+def _index_html() -> bytes:
+    """index.html bytes cached in memory for the SPA fallback response."""
+    return (FRONTEND_DIR / 'index.html').read_bytes()
+
+# Security headers added to every response. Precomputed once so the
+# middleware only extends a list per request instead of building objects.
+SECURITY_HEADERS = (
+    ('X-Content-Type-Options', 'nosniff'),
+    ('X-Frame-Options', 'DENY'),
+    ('X-XSS-Protection', '1; mode=block'),
+)
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson's C encoder.
+
+    Every jsonify call in the API goes through the app's JSON provider,
+    so swapping the stdlib encoder for orjson speeds up all JSON
+    responses (health, listings, extraction results) without touching
+    the route handlers.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that skips the per-record os.path.isfile check.
+
+    The stock shouldRollover stats the log file on every emit. When the
+    stream position is still well below maxBytes no rollover can be
+    needed, so answer from the open stream and only fall back to the
+    base-class check near the size limit.
+    """
+
+    def shouldRollover(self, record):
+        if self.stream is None:
+            return False
+        if self.maxBytes > 0:
+            msg_len = len(self.format(record)) + 1
+            if self.stream.tell() + msg_len < self.maxBytes:
+                return False
+        return super().shouldRollover(record)
+
+
+class SecurityHeadersMiddleware:
+    """
+    WSGI middleware that appends security headers to every response.
+
+    Runs below Flask so no Request/Response objects are constructed for
+    the header work - the raw header list is extended in start_response.
+    """
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        def start_response_with_headers(status, headers, exc_info=None):
+            headers.extend(SECURITY_HEADERS)
+            return start_response(status, headers, exc_info)
+
+        return self.wsgi_app(environ, start_response_with_headers)
+
+
+@lru_cache(maxsize=1)
+def _get_file_handler(log_format: str, log_level: int) -> MemoryHandler:
+    """
+    Create the shared buffered log file handler.
+
+    Cached so repeated create_app() calls (test fixtures, --reload)
+    reuse one file descriptor and one logs/ mkdir instead of opening a
+    new handler per app instance.
+    """
+    log_dir = Path(__file__).resolve().parent.parent / 'logs'
+    log_dir.mkdir(exist_ok=True)
+    file_handler = FastRotatingFileHandler(
+        log_dir / 'app.log',
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=5
+    )
+    file_handler.setFormatter(logging.Formatter(log_format))
+    file_handler.setLevel(log_level)
+    # Buffer records in memory and flush in batches so a request that
+    # logs several lines makes one write() instead of one per record.
+    # ERROR-level records (and shutdown) still flush immediately.
+    buffered_handler = MemoryHandler(
+        capacity=512,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
+    atexit.register(buffered_handler.flush)
+    return buffered_handler
+
 
 def setup_logging(app):
     """
     Configure structured logging for the application.
-    
+
     Args:
         app: Flask application instance
     """
     log_level = getattr(logging, app.config['LOG_LEVEL'].upper(), logging.INFO)
     log_format = app.config['LOG_FORMAT']
-    
+
     # Configure root logger
     logging.basicConfig(
         level=log_level,
         format=log_format
     )
-    
-    # Add file handler for persistent logs
+
+    # Add the process-wide file handler for persistent logs
     try:
-        log_dir = Path(__file__).resolve().parent.parent / 'logs'
-        log_dir.mkdir(exist_ok=True)
-        file_handler = RotatingFileHandler(
-            log_dir / 'app.log',
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
-        )
-        file_handler.setFormatter(logging.Formatter(log_format))
-        file_handler.setLevel(log_level)
-        app.logger.addHandler(file_handler)
+        buffered_handler = _get_file_handler(log_format, log_level)
+        if buffered_handler not in app.logger.handlers:
+            app.logger.addHandler(buffered_handler)
     except Exception as e:
         app.logger.warning(f"Could not create log file: {e}")
-    
+
     app.logger.setLevel(log_level)
     app.logger.info(f"Logging configured. Level: {app.config['LOG_LEVEL']}")
 
@@ -65,6 +171,10 @@ def create_app(config_name: str = None):
     
     app = Flask(__name__)
     app.config.from_object(get_config())
+
+    # Serialize all jsonify responses with orjson when available
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
     
     # Setup logging
     setup_logging(app)
@@ -84,17 +194,17 @@ def create_app(config_name: str = None):
     # Request logging middleware
     @app.before_request
     def log_request_info():
-        app.logger.debug('Headers: %s', dict(request.headers))
-        app.logger.debug('Body: %s', request.get_data())
-    
-    @app.after_request
-    def add_security_headers(response):
-        """Add security headers to all responses."""
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['X-Frame-Options'] = 'DENY'
-        response.headers['X-XSS-Protection'] = '1; mode=block'
-        return response
+        # Skip entirely unless DEBUG is enabled - building the header dict
+        # is wasted work in production. Never read the body: get_data()
+        # would buffer the whole upload (up to 10MB) just for a log line
+        # and exhaust the stream before the upload handler reads it.
+        if app.logger.isEnabledFor(logging.DEBUG):
+            app.logger.debug('Headers: %s', dict(request.headers))
+            app.logger.debug('Content-Length: %s', request.content_length)
     
+    # Add security headers at the WSGI layer instead of per-response hooks
+    app.wsgi_app = SecurityHeadersMiddleware(app.wsgi_app)
+
     # Health check endpoint
     @app.route('/api/health', methods=['GET'])
     def health_check():
@@ -109,26 +219,44 @@ def create_app(config_name: str = None):
     @app.route('/', methods=['GET'])
     def serve_index():
         """Serve the main index.html page."""
-        from flask import send_from_directory
-        frontend_path = Path(__file__).resolve().parent.parent / 'frontend'
-        return send_from_directory(frontend_path, 'index.html')
-    
+        return send_from_directory(FRONTEND_DIR, 'index.html')
+
     # Serve static files from frontend
     @app.route('/<path:filename>', methods=['GET'])
     def serve_static(filename):
         """Serve static files from frontend directory."""
-        from flask import send_from_directory
-        frontend_path = Path(__file__).resolve().parent.parent / 'frontend'
-        # Check if it's a file in frontend directory
-        file_path = frontend_path / filename
-        if file_path.exists() and file_path.is_file():
-            return send_from_directory(frontend_path, filename)
-        # Otherwise serve index.html for SPA routing
-        return send_from_directory(frontend_path, 'index.html')
+        # Extensionless paths are SPA routes - answer from the in-memory
+        # index.html without touching the disk at all.
+        if '.' not in filename:
+            return _spa_fallback()
+        # Let send_from_directory do the single stat; its 404 doubles as
+        # the "not a real file" signal for the SPA fallback, so no extra
+        # exists()/is_file() syscalls are needed here.
+        try:
+            response = send_from_directory(FRONTEND_DIR, filename)
+        except NotFound:
+            return _spa_fallback()
+        # JS/CSS/images rarely change - let browsers cache them and
+        # revalidate via the ETag send_from_directory already sets.
+        if filename.endswith(('.js', '.css', '.png', '.jpg', '.svg', '.ico')):
+            response.cache_control.public = True
+            response.cache_control.max_age = 86400
+        return response
+
+    def _spa_fallback():
+        """Serve the cached index.html for SPA routing - never cached by
+        the browser so route changes are picked up immediately."""
+        from flask import Response
+        response = Response(_index_html(), mimetype='text/html')
+        response.cache_control.no_cache = True
+        return response
     
     # Register blueprints
     register_blueprints(app)
-    
+
+    # Create shared service singletons
+    init_services(app)
+
     # Ensure upload directories exist
     ensure_directories(app)
     
@@ -158,6 +286,32 @@ def register_blueprints(app):
     app.logger.info("All blueprints registered successfully")
 
 
+def init_services(app):
+    """
+    Create the shared service instances used by the route handlers.
+
+    The services are stateless, so one instance per app replaces the
+    per-request construction the routes used to do. This also keeps the
+    AI processor's cached HTTP client warm across requests.
+
+    Args:
+        app: Flask application instance
+    """
+    from backend.services.ai_processor import AIProcessor
+    from backend.services.json_formatter import JSONFormatter
+    from backend.services.pdf_reader import PDFReader
+    from backend.services.storage_service import StorageService
+    from backend.utils.file_validator import FileValidator
+
+    app.extensions['ai'] = AIProcessor()
+    app.extensions['pdf'] = PDFReader()
+    app.extensions['formatter'] = JSONFormatter()
+    app.extensions['storage'] = StorageService()
+    app.extensions['validator'] = FileValidator()
+
+    app.logger.info("Shared services initialized")
+
+
 def ensure_directories(app):
     """
     Ensure required directories exist.
@@ -184,9 +338,13 @@ def init_database(app):
         app: Flask application instance
     """
     try:
-        from backend.models.database import init_db, create_tables
+        from backend.models.database import init_db, create_tables, close_session
         init_db(app)
         create_tables()
+        # Release the scoped session when the request context tears down -
+        # the CRUD helpers share one session per request instead of
+        # opening and closing one per query.
+        app.teardown_appcontext(close_session)
         app.logger.info("Database initialized and tables created")
     except Exception as e:
         app.logger.warning(f"Could not initialize database: {e}")
@@ -3,6 +3,8 @@ Centralized configuration for the Flask application.
 Loads environment variables using python-dotenv.
 """
 import os
+import secrets
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -17,7 +19,9 @@ class Config:
     # Flask settings
     FLASK_ENV = os.getenv('FLASK_ENV', 'production')
     FLASK_DEBUG = os.getenv('FLASK_DEBUG', '0') == '1'
-    SECRET_KEY = os.getenv('SECRET_KEY', os.urandom(24).hex())
+    # `or` short-circuits, so the random fallback is only generated when
+    # the env var is absent (os.getenv's default arg would always run it)
+    SECRET_KEY = os.environ.get('SECRET_KEY') or secrets.token_hex(24)
     
     # API Keys
     GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
@@ -27,6 +31,18 @@ class Config:
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
+    # Static/download file serving
+    # When enabled, send_file emits an X-Sendfile header and lets the
+    # fronting server (nginx/Apache) stream the bytes via sendfile(2)
+    # instead of pushing them through Python. Requires the proxy to be
+    # configured for it, so it is opt-in via environment.
+    USE_X_SENDFILE = os.getenv('USE_X_SENDFILE', '0') == '1'
+
+    # No SEND_FILE_MAX_AGE_DEFAULT: a global max-age would also make the
+    # /api/download responses (regenerated JSON) browser-cacheable for
+    # the same period. Long-lived caching for frontend assets is applied
+    # explicitly in serve_static instead.
+
     # File upload settings
     MAX_CONTENT_LENGTH = 10 * 1024 * 1024  # 10MB max file size
     ALLOWED_EXTENSIONS = {'pdf'}
@@ -70,10 +86,14 @@ config_by_name = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_config():
     """
     Get the configuration object based on FLASK_ENV.
-    
+
+    Cached so repeated callers (app factory, services, DB init) don't
+    re-read the environment.
+
     Returns:
         Config: The configuration object
     """
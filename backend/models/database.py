@@ -2,9 +2,10 @@
 Database configuration and models.
 """
 import logging
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import StaticPool
 from backend.config import Config
 
 # Create logger
@@ -26,7 +27,12 @@ def init_db(app=None):
         app: Flask application instance (optional)
     """
     global engine, SessionLocal
-    
+
+    # Engine creation is process-wide; repeated create_app() calls (test
+    # fixtures, --reload, gunicorn preload) reuse the existing engine.
+    if engine is not None:
+        return engine
+
     try:
         # Get database URI from config
         if app:
@@ -37,17 +43,40 @@ def init_db(app=None):
         logger.info(f"Initializing database: {db_uri}")
         
         # Create engine
-        engine = create_engine(
-            db_uri,
-            echo=Config.FLASK_DEBUG,
-            pool_pre_ping=True
-        )
+        engine_kwargs = {
+            'echo': Config.FLASK_DEBUG,
+            'pool_pre_ping': True
+        }
+        if db_uri.startswith('sqlite'):
+            # SQLite connections are used across gthread worker threads
+            engine_kwargs['connect_args'] = {'check_same_thread': False}
+            if ':memory:' in db_uri:
+                # Share the single in-memory DB between threads (testing)
+                engine_kwargs['poolclass'] = StaticPool
+
+        engine = create_engine(db_uri, **engine_kwargs)
+
+        if db_uri.startswith('sqlite'):
+            @event.listens_for(engine, 'connect')
+            def _set_sqlite_pragmas(dbapi_conn, _):
+                # WAL lets readers run concurrently with a writer;
+                # synchronous=NORMAL halves fsyncs (safe under WAL); the
+                # rest keep temp data and page cache in memory.
+                cursor = dbapi_conn.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute("PRAGMA mmap_size=268435456")
+                cursor.execute("PRAGMA cache_size=-64000")
+                cursor.close()
         
-        # Create session factory
+        # Create session factory. expire_on_commit=False keeps attribute
+        # access after commit from re-SELECTing rows the caller already has.
         SessionLocal = scoped_session(
             sessionmaker(
                 autocommit=False,
                 autoflush=False,
+                expire_on_commit=False,
                 bind=engine
             )
         )
@@ -62,8 +91,13 @@ def init_db(app=None):
 
 def get_session():
     """
-    Get a database session.
-    
+    Get the request-scoped database session.
+
+    The scoped_session proxy returns the same session for the duration of
+    a request, so repeated helper calls share one connection. The session
+    is released by close_session() in the app teardown handler rather
+    than after each query.
+
     Returns:
         Database session
     """
@@ -124,8 +158,6 @@ def save_pdf_metadata(file_id: str, original_filename: str, stored_filename: str
         session.rollback()
         logger.error(f"Failed to save PDF metadata: {e}")
         raise
-    finally:
-        session.close()
 
 
 def get_pdf_by_file_id(file_id: str) -> 'PDFFile':
@@ -147,17 +179,26 @@ def get_pdf_by_file_id(file_id: str) -> 'PDFFile':
     except Exception as e:
         logger.error(f"Failed to get PDF metadata: {e}")
         raise
-    finally:
-        session.close()
+
+
+_tables_created = False
 
 
 def create_tables():
-    """Create all database tables."""
+    """Create all database tables (runs at most once per process)."""
+    global _tables_created
+
     if engine is None:
         init_db()
-    
+
+    # create_all introspects sqlite_master per table; skip the repeat
+    # work when the tables are already in place for this process.
+    if _tables_created:
+        return
+
     try:
         Base.metadata.create_all(bind=engine)
+        _tables_created = True
         logger.info("All database tables created")
     except Exception as e:
         logger.error(f"Failed to create tables: {e}")
@@ -190,8 +231,6 @@ def create_pdf(filename: str):
         session.rollback()
         logger.error(f"Failed to create PDF: {e}")
         raise
-    finally:
-        session.close()
 
 
 def get_pdf_by_id(pdf_id: int):
@@ -212,27 +251,34 @@ def get_pdf_by_id(pdf_id: int):
     except Exception as e:
         logger.error(f"Failed to get PDF: {e}")
         raise
-    finally:
-        session.close()
 
 
 def get_all_pdfs() -> list:
     """
-    Get all PDF records.
-    
+    Get all PDF records with their MCQ counts.
+
+    The counts come from a single aggregate join rather than one
+    COUNT(*) query per PDF when rows are serialized via to_dict.
+
     Returns:
-        List of PDFFile records
+        List of (PDFFile, mcq_count) tuples
     """
+    from sqlalchemy import func
     from backend.models.pdf_model import PDFFile
-    
+    from backend.models.mcq_model import MCQ
+
     session = get_session()
     try:
-        return session.query(PDFFile).order_by(PDFFile.upload_date.desc()).all()
+        return (
+            session.query(PDFFile, func.count(MCQ.id))
+            .outerjoin(MCQ)
+            .group_by(PDFFile.id)
+            .order_by(PDFFile.upload_date.desc())
+            .all()
+        )
     except Exception as e:
         logger.error(f"Failed to get PDFs: {e}")
         raise
-    finally:
-        session.close()
 
 
 def delete_pdf(pdf_id: int) -> bool:
@@ -260,8 +306,6 @@ def delete_pdf(pdf_id: int) -> bool:
         session.rollback()
         logger.error(f"Failed to delete PDF: {e}")
         raise
-    finally:
-        session.close()
 
 
 # ============== MCQ Model Functions ==============
@@ -298,48 +342,43 @@ def create_mcq(pdf_id: int, question: str, options: list, answer: str):
         session.rollback()
         logger.error(f"Failed to create MCQ: {e}")
         raise
-    finally:
-        session.close()
 
 
 def create_mcqs_bulk(pdf_id: int, mcqs: list) -> list:
     """
-    Create multiple MCQ records.
-    
+    Create multiple MCQ records in a single multi-row INSERT.
+
     Args:
         pdf_id: ID of the parent PDF
         mcqs: List of MCQ dictionaries with question, options, answer
-    
+
     Returns:
-        List of created MCQ records
+        List of inserted row dictionaries
     """
     from backend.models.mcq_model import MCQ
-    
+
     session = get_session()
-    created = []
     try:
-        for mcq_data in mcqs:
-            mcq = MCQ(
-                pdf_id=pdf_id,
-                question=mcq_data.get('question', ''),
-                options=mcq_data.get('options', []),
-                answer=mcq_data.get('answer', '')
-            )
-            session.add(mcq)
-            created.append(mcq)
-        
+        rows = [
+            {
+                'pdf_id': pdf_id,
+                'question': mcq_data.get('question', ''),
+                'options': mcq_data.get('options', []),
+                'answer': mcq_data.get('answer', '')
+            }
+            for mcq_data in mcqs
+        ]
+        # One multi-row INSERT instead of per-row add() plus a refresh
+        # SELECT per record after commit.
+        session.bulk_insert_mappings(MCQ, rows)
         session.commit()
-        for mcq in created:
-            session.refresh(mcq)
-        
-        logger.info(f"Created {len(created)} MCQs for pdf_id={pdf_id}")
-        return created
+
+        logger.info(f"Created {len(rows)} MCQs for pdf_id={pdf_id}")
+        return rows
     except Exception as e:
         session.rollback()
         logger.error(f"Failed to create MCQs: {e}")
         raise
-    finally:
-        session.close()
 
 
 def get_mcqs_by_pdf_id(pdf_id: int) -> list:
@@ -360,8 +399,6 @@ def get_mcqs_by_pdf_id(pdf_id: int) -> list:
     except Exception as e:
         logger.error(f"Failed to get MCQs: {e}")
         raise
-    finally:
-        session.close()
 
 
 def get_mcq_by_id(mcq_id: int):
@@ -382,8 +419,6 @@ def get_mcq_by_id(mcq_id: int):
     except Exception as e:
         logger.error(f"Failed to get MCQ: {e}")
         raise
-    finally:
-        session.close()
 
 
 def delete_mcq(mcq_id: int) -> bool:
@@ -411,5 +446,3 @@ def delete_mcq(mcq_id: int) -> bool:
         session.rollback()
         logger.error(f"Failed to delete MCQ: {e}")
         raise
-    finally:
-        session.close()
@@ -32,8 +32,15 @@ class PDFFile(Base):
     def __repr__(self):
         return f"<PDFFile(id={self.id}, file_id={self.file_id}, original_filename={self.original_filename})>"
     
-    def to_dict(self):
-        """Convert model to dictionary."""
+    def to_dict(self, mcq_count=None):
+        """
+        Convert model to dictionary.
+
+        Args:
+            mcq_count: Precomputed MCQ count (e.g. from get_all_pdfs'
+                aggregate join). Falls back to a COUNT query per row
+                when not supplied.
+        """
         return {
             'id': self.id,
             'file_id': self.file_id,
@@ -44,5 +51,5 @@ class PDFFile(Base):
             'mime_type': self.mime_type,
             'status': self.status,
             'upload_date': self.upload_date.isoformat() if self.upload_date else None,
-            'mcq_count': self.mcqs.count()
+            'mcq_count': mcq_count if mcq_count is not None else self.mcqs.count()
         }
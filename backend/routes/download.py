@@ -2,6 +2,8 @@
 Download API route - handles file downloads.
 """
 import logging
+import os
+from functools import lru_cache
 from flask import Blueprint, jsonify, request, send_file
 from backend.utils.error_handler import ValidationError, NotFoundError
 from backend.config import Config
@@ -14,6 +16,35 @@ logger = logging.getLogger(__name__)
 bp = Blueprint('download', __name__)
 
 
+@lru_cache(maxsize=1)
+def _storage() -> StorageService:
+    """Shared StorageService - it's stateless, so build it once."""
+    return StorageService()
+
+
+# Directory-listing cache keyed by kind ('json'/'pdf'), storing
+# (directory mtime_ns, listing). A directory's mtime changes whenever an
+# entry is added or removed, so one stat on the directory tells us
+# whether the cached listing is still valid.
+_listing_cache = {}
+
+
+def _cached_listing(kind: str, directory, scan) -> list:
+    """Return the cached listing for a directory, rescanning on mtime change."""
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return []
+
+    cached = _listing_cache.get(kind)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    listing = scan()
+    _listing_cache[kind] = (mtime, listing)
+    return listing
+
+
 @bp.route('/<file_id>', methods=['GET'])
 def download_json_by_id(file_id: str):
     """
@@ -28,7 +59,7 @@ def download_json_by_id(file_id: str):
     logger.info(f"Download request for file_id: {file_id}")
     
     try:
-        storage = StorageService()
+        storage = _storage()
         file_path = storage.get_json_by_uuid(file_id)
         
         if not file_path:
@@ -72,7 +103,7 @@ def download_json(filename: str):
     logger.info(f"Download request for JSON: {filename}")
     
     try:
-        storage = StorageService()
+        storage = _storage()
         file_path = storage.get_json_path(filename)
         
         if not file_path.exists():
@@ -107,18 +138,22 @@ def download_pdf(filename: str):
     logger.info(f"Download request for PDF: {filename}")
     
     try:
-        storage = StorageService()
+        storage = _storage()
         file_path = storage.get_pdf_path(filename)
         
         if not file_path.exists():
             logger.warning(f"File not found: {filename}")
             raise NotFoundError(f"File not found: {filename}")
         
+        # conditional=True enables Werkzeug's Range / If-Modified-Since
+        # handling, so browsers can resume partial PDF transfers (206)
+        # instead of re-downloading the whole file.
         return send_file(
             file_path,
             mimetype='application/pdf',
             as_attachment=True,
-            download_name=filename
+            download_name=filename,
+            conditional=True
         )
         
     except NotFoundError:
@@ -139,9 +174,9 @@ def list_files():
     logger.info("Listing available files")
     
     try:
-        storage = StorageService()
-        json_files = storage.list_json_files()
-        pdf_files = storage.list_pdf_files()
+        storage = _storage()
+        json_files = _cached_listing('json', storage.json_folder, storage.list_json_files)
+        pdf_files = _cached_listing('pdf', storage.upload_folder, storage.list_pdf_files)
         
         return jsonify({
             'success': True,
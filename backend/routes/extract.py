@@ -3,14 +3,20 @@ Extract API route - handles MCQ extraction from PDFs.
 """
 import logging
 import json
-from flask import Blueprint, jsonify, request
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from flask import Blueprint, Response, current_app, jsonify, request
 from werkzeug.utils import secure_filename
 from backend.utils.error_handler import ValidationError, NotFoundError
+from backend.utils.helpers import parse_bool
 from backend.config import Config
-from backend.services.ai_processor import AIProcessor
-from backend.services.pdf_reader import PDFReader, PDFReadError, PDFNoTextError
-from backend.services.json_formatter import JSONFormatter
-from backend.services.storage_service import StorageService
+from backend.services.pdf_reader import PDFReadError, PDFNoTextError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Create logger
 logger = logging.getLogger(__name__)
@@ -18,6 +24,102 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 bp = Blueprint('extract', __name__)
 
+# Background task registry. Extraction holds a worker for seconds of
+# LLM latency; running it on this executor lets the upload request
+# return a task_id immediately and /status/<task_id> report real
+# progress. The dict is only a fast path for polls that land on the
+# submitting process - production runs several gunicorn workers (see
+# gunicorn.conf.py), so every transition is also persisted through
+# StorageService where any worker can read it. An external queue
+# (RQ/Celery) would be overkill at this scale.
+MAX_TRACKED_TASKS = 256
+
+_task_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='extract-task')
+_tasks = {}
+_tasks_lock = threading.Lock()
+
+
+def _set_task_status(task_id: str, status: str, progress: int, **extra):
+    """Record a task's status transition, pruning old finished tasks."""
+    with _tasks_lock:
+        entry = _tasks.setdefault(task_id, {})
+        entry['status'] = status
+        entry['progress'] = progress
+        entry.update(extra)
+        snapshot = dict(entry)
+        if len(_tasks) > MAX_TRACKED_TASKS:
+            for old_id in [t for t, e in _tasks.items()
+                           if t != task_id and e.get('status') in ('done', 'error')]:
+                del _tasks[old_id]
+                if len(_tasks) <= MAX_TRACKED_TASKS:
+                    break
+
+    # Persist outside the lock so a slow disk doesn't block other
+    # status transitions; a lost snapshot only costs one stale poll
+    try:
+        current_app.extensions['storage'].save_task_status(
+            json.dumps(snapshot), task_id)
+    except Exception as e:
+        logger.warning(f"Failed to persist status for task {task_id}: {e}")
+
+
+def _run_extraction_task(app, task_id: str, file_id: str):
+    """Run the full extraction pipeline in the background executor."""
+    with app.app_context():
+        try:
+            _set_task_status(task_id, 'reading', 10)
+            pdf_reader = app.extensions['pdf']
+            text_content, page_count = pdf_reader.read_pdf_from_storage(file_id)
+
+            _set_task_status(task_id, 'llm', 40)
+            ai_processor = app.extensions['ai']
+            raw_mcqs = ai_processor.extract_mcq(text_content)
+
+            formatter = app.extensions['formatter']
+            formatted_mcqs = formatter.format_mcq(raw_mcqs)
+
+            _set_task_status(task_id, 'saving', 90)
+            storage = app.extensions['storage']
+            storage.save_json_by_uuid(_dumps_indented(formatted_mcqs), file_id)
+
+            _set_task_status(task_id, 'done', 100, count=len(formatted_mcqs))
+            logger.info(f"Background extraction finished for task {task_id}")
+        except Exception as e:
+            logger.exception(f"Background extraction failed for task {task_id}: {e}")
+            _set_task_status(task_id, 'error', 100, error=str(e))
+
+
+def _dumps_indented(obj) -> str:
+    """Serialize MCQs for storage with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _loads(text: str):
+    """Parse stored JSON with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _mcq_response(message: str, file_id: str, mcqs_json: str, count: int, cached: bool) -> Response:
+    """
+    Build the extraction response around already-serialized MCQ JSON.
+
+    mcqs_json is the JSON array string that was written to (or read from)
+    storage; splicing it into the response body avoids serializing the
+    MCQ list a second time for the HTTP payload.
+    """
+    body = '{"success":true,"message":%s,"file_id":%s,"mcqs":%s,"count":%d,"cached":%s}' % (
+        json.dumps(message),
+        json.dumps(file_id),
+        mcqs_json,
+        count,
+        'true' if cached else 'false'
+    )
+    return Response(body, mimetype='application/json')
+
 
 @bp.route('/mcq', methods=['POST'])
 def extract_mcq():
@@ -44,24 +146,25 @@ def extract_mcq():
         logger.warning("Empty filename provided")
         raise ValidationError("No file selected. Please select a PDF file.")
     
-    # Validate file extension
-    if not file.filename.lower().endswith('.pdf'):
+    # Validate file extension - lowercase only the 4-char suffix instead
+    # of allocating a lowercased copy of the whole filename
+    if file.filename[-4:].lower() != '.pdf':
         logger.warning(f"Invalid file type: {file.filename}")
         raise ValidationError("Invalid file type. Only PDF files are allowed.")
     
     try:
-        # Read PDF content
-        pdf_reader = PDFReader()
+        # Read PDF content - the services are app-level singletons
+        pdf_reader = current_app.extensions['pdf']
         text_content = pdf_reader.read_pdf(file)
         logger.info(f"PDF read successfully, extracted {len(text_content)} characters")
-        
+
         # Process with AI
-        ai_processor = AIProcessor()
+        ai_processor = current_app.extensions['ai']
         raw_mcqs = ai_processor.extract_mcq(text_content)
         logger.info(f"Extracted {len(raw_mcqs)} MCQs from AI")
-        
+
         # Format to JSON
-        formatter = JSONFormatter()
+        formatter = current_app.extensions['formatter']
         formatted_mcqs = formatter.format_mcq(raw_mcqs)
         logger.info("MCQs formatted successfully")
         
@@ -95,14 +198,37 @@ def get_extraction_status(task_id: str):
         JSON response with task status
     """
     logger.info(f"Checking status for task: {task_id}")
-    
-    # TODO: Implement task status checking with database
-    return jsonify({
-        'success': True,
+
+    with _tasks_lock:
+        entry = _tasks.get(task_id)
+        if entry is not None:
+            entry = dict(entry)
+
+    if entry is None and secure_filename(task_id) == task_id:
+        # Poll landed on a different gunicorn worker than the submit -
+        # read the snapshot the submitting worker persisted. The
+        # secure_filename guard keeps path components out of the lookup.
+        stored = current_app.extensions['storage'].get_task_status(task_id)
+        if stored:
+            try:
+                entry = _loads(stored)
+            except ValueError:
+                entry = None
+
+    if entry is None:
+        raise NotFoundError(f"No extraction task found with id: {task_id}")
+
+    response = {
+        'success': entry['status'] != 'error',
         'task_id': task_id,
-        'status': 'completed',
-        'progress': 100
-    }), 200
+        'status': entry['status'],
+        'progress': entry['progress']
+    }
+    for key in ('file_id', 'count', 'error'):
+        if key in entry:
+            response[key] = entry[key]
+
+    return jsonify(response), 200
 
 
 @bp.route('/<file_id>', methods=['GET', 'POST'])
@@ -126,29 +252,50 @@ def extract_text_from_file(file_id: str):
     
     try:
         # FIRST: Check if JSON already exists (cache) - avoid duplicate API calls
-        storage = StorageService()
+        storage = current_app.extensions['storage']
         existing_json = storage.get_json_by_uuid(file_id)
         
         if existing_json:
             # Return cached results - no need to call API again
             logger.info(f"Returning cached MCQs for file_id: {file_id}")
             try:
-                cached_mcqs = json.loads(existing_json)
-                return jsonify({
-                    'success': True,
-                    'message': 'MCQs loaded from cache',
-                    'file_id': file_id,
-                    'mcqs': cached_mcqs,
-                    'count': len(cached_mcqs),
-                    'cached': True
-                }), 200
-            except json.JSONDecodeError:
+                # Parse only to validate and count - the response reuses
+                # the stored JSON string instead of re-serializing
+                cached_mcqs = _loads(existing_json)
+                return _mcq_response(
+                    'MCQs loaded from cache',
+                    file_id,
+                    existing_json,
+                    len(cached_mcqs),
+                    cached=True
+                ), 200
+            except ValueError:
                 logger.warning("Failed to parse cached JSON, will re-extract")
-        
+
+        # Asynchronous mode: enqueue the pipeline on the background
+        # executor and return immediately; progress is polled via
+        # /status/<task_id>
+        if parse_bool(request.args.get('async', False)):
+            task_id = str(uuid.uuid4())
+            storage.prune_task_statuses()
+            _set_task_status(task_id, 'queued', 0, file_id=file_id)
+            _task_executor.submit(
+                _run_extraction_task,
+                current_app._get_current_object(),
+                task_id,
+                file_id
+            )
+            logger.info(f"Queued background extraction task {task_id} for file_id: {file_id}")
+            return jsonify({
+                'success': True,
+                'task_id': task_id,
+                'file_id': file_id,
+                'status': 'queued'
+            }), 202
+
         # If no cache, proceed with extraction
-        # Initialize PDF reader
-        pdf_reader = PDFReader()
-        
+        pdf_reader = current_app.extensions['pdf']
+
         # Show processing status - reading PDF
         logger.info("Reading PDF file from storage...")
         
@@ -159,31 +306,33 @@ def extract_text_from_file(file_id: str):
         
         # Process with AI to extract MCQs
         logger.info("Extracting MCQs using AI...")
-        ai_processor = AIProcessor()
+        ai_processor = current_app.extensions['ai']
         raw_mcqs = ai_processor.extract_mcq(text_content)
         logger.info(f"Extracted {len(raw_mcqs)} MCQs from AI")
-        
+
         # Format to JSON
-        formatter = JSONFormatter()
+        formatter = current_app.extensions['formatter']
         formatted_mcqs = formatter.format_mcq(raw_mcqs)
         logger.info("MCQs formatted successfully")
         
+        # Serialize once; the same JSON string is saved to storage and
+        # spliced into the HTTP response below
+        json_content = _dumps_indented(formatted_mcqs)
+
         # Save JSON to storage (cache for future requests)
         try:
-            json_content = json.dumps(formatted_mcqs, indent=2, ensure_ascii=False)
             storage.save_json_by_uuid(json_content, file_id)
             logger.info(f"JSON saved to storage for file_id: {file_id}")
         except Exception as save_error:
             logger.warning(f"Failed to save JSON to storage: {save_error}")
-        
-        return jsonify({
-            'success': True,
-            'message': 'MCQs extracted successfully',
-            'file_id': file_id,
-            'mcqs': formatted_mcqs,
-            'count': len(formatted_mcqs),
-            'cached': False
-        }), 200
+
+        return _mcq_response(
+            'MCQs extracted successfully',
+            file_id,
+            json_content,
+            len(formatted_mcqs),
+            cached=False
+        ), 200
         
     except PDFNoTextError as e:
         logger.warning(f"PDF has no text (possibly scanned): {str(e)}")
@@ -3,11 +3,9 @@ Upload API route - handles file uploads.
 """
 import logging
 import uuid
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from werkzeug.utils import secure_filename
-from backend.utils.file_validator import FileValidator
 from backend.config import Config
-from backend.services.storage_service import StorageService
 from backend.models.database import save_pdf_metadata
 
 # Create logger
@@ -33,8 +31,20 @@ def upload_file():
     """
     logger.info("[DIAG] Entered upload_file route")
     try:
-        # Initialize validator
-        validator = FileValidator()
+        # Shared app-level validator singleton
+        validator = current_app.extensions['validator']
+
+        # Reject oversized bodies from the Content-Length header before
+        # request.files triggers the multipart parse - no point burning
+        # CPU parsing megabytes we're going to refuse anyway.
+        if request.content_length and request.content_length > MAX_FILE_SIZE:
+            max_size_mb = MAX_FILE_SIZE / (1024 * 1024)
+            logger.warning(f"Upload rejected by Content-Length: {request.content_length}")
+            return jsonify({
+                'status': 'error',
+                'message': f'File too large. Maximum size is {max_size_mb:.0f}MB.',
+                'file_id': ''
+            }), 400
 
         # Check if file is in request
         if 'file' not in request.files:
@@ -58,31 +68,31 @@ def upload_file():
 
         # Validate file extension using file_validator
         ext_result = validator.validate_extension(file.filename)
-        if not ext_result['valid']:
+        if not ext_result.valid:
             logger.warning(f"Invalid file extension: {file.filename}")
             return jsonify({
                 'status': 'error',
-                'message': ext_result['message'],
+                'message': ext_result.message,
                 'file_id': ''
             }), 400
 
         # Validate MIME type using file_validator
         mime_result = validator.validate_mime_type(file)
-        if not mime_result['valid']:
+        if not mime_result.valid:
             logger.warning(f"Invalid MIME type: {file.content_type}")
             return jsonify({
                 'status': 'error',
-                'message': mime_result['message'],
+                'message': mime_result.message,
                 'file_id': ''
             }), 400
 
         # Validate file size using file_validator
         size_result = validator.validate_file_size(file)
-        if not size_result['valid']:
-            logger.warning(f"File size validation failed: {size_result['message']}")
+        if not size_result.valid:
+            logger.warning(f"File size validation failed: {size_result.message}")
             return jsonify({
                 'status': 'error',
-                'message': size_result['message'],
+                'message': size_result.message,
                 'file_id': ''
             }), 400
 
@@ -93,7 +103,7 @@ def upload_file():
             unique_filename = f"{file_id}_{original_filename}"
 
             # Save file using storage service
-            storage = StorageService()
+            storage = current_app.extensions['storage']
             file_path = storage.save_upload(file, unique_filename)
             logger.info(f"File saved successfully: {file_path}")
 
@@ -104,7 +114,7 @@ def upload_file():
                     original_filename=original_filename,
                     stored_filename=unique_filename,
                     file_path=str(file_path),
-                    file_size=size_result['details']['file_size'],
+                    file_size=size_result.details['file_size'],
                     mime_type='application/pdf'
                 )
                 logger.info(f"File metadata saved to database: file_id={file_id}")
@@ -113,23 +123,20 @@ def upload_file():
 
             # EXTRACT MCQs IMMEDIATELY - in same request
             try:
-                from backend.services.pdf_reader import PDFReader
-                from backend.services.ai_processor import AIProcessor
-                from backend.services.json_formatter import JSONFormatter
                 import json
 
                 # Read PDF
-                pdf_reader = PDFReader()
+                pdf_reader = current_app.extensions['pdf']
                 text_content = pdf_reader.read_pdf_from_storage(file_id)
                 logger.info(f"PDF read for extraction: {len(text_content[0])} characters")
 
                 # Extract MCQs using AI
-                ai_processor = AIProcessor()
+                ai_processor = current_app.extensions['ai']
                 raw_mcqs = ai_processor.extract_mcq(text_content[0])
                 logger.info(f"Extracted {len(raw_mcqs)} MCQs from AI")
 
                 # Format MCQs
-                formatter = JSONFormatter()
+                formatter = current_app.extensions['formatter']
                 formatted_mcqs = formatter.format_mcq(raw_mcqs)
                 
                 # Save JSON to storage
@@ -186,10 +193,10 @@ def validate_upload():
         JSON response with validation result
     """
     logger.info("Starting file validation")
-    
-    # Initialize validator
-    validator = FileValidator()
-    
+
+    # Shared app-level validator singleton
+    validator = current_app.extensions['validator']
+
     # Check if file is in request
     if 'file' not in request.files:
         logger.warning("No file provided in request")
@@ -206,7 +213,7 @@ def validate_upload():
     mime_result = validator.validate_mime_type(file)
     size_result = validator.validate_file_size(file)
     
-    is_valid = ext_result['valid'] and mime_result['valid'] and size_result['valid']
+    is_valid = ext_result.valid and mime_result.valid and size_result.valid
     
     if is_valid:
         return jsonify({
@@ -216,12 +223,12 @@ def validate_upload():
         }), 200
     else:
         # Return the first error message
-        if not ext_result['valid']:
-            message = ext_result['message']
-        elif not mime_result['valid']:
-            message = mime_result['message']
+        if not ext_result.valid:
+            message = ext_result.message
+        elif not mime_result.valid:
+            message = mime_result.message
         else:
-            message = size_result['message']
+            message = size_result.message
             
         return jsonify({
             'status': 'error',
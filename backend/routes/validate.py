@@ -2,10 +2,8 @@
 Validate API route - handles validation of files and MCQs.
 """
 import logging
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from backend.utils.error_handler import ValidationError
-from backend.utils.file_validator import FileValidator
-from backend.services.json_formatter import JSONFormatter
 
 # Create logger
 logger = logging.getLogger(__name__)
@@ -24,14 +22,14 @@ def validate_file():
         raise ValidationError("No file provided. Please upload a PDF file.")
     
     file = request.files['file']
-    validator = FileValidator()
+    validator = current_app.extensions['validator']
     result = validator.validate_pdf(file)
     
     return jsonify({
         'success': True,
-        'valid': result['valid'],
-        'message': result['message'],
-        'details': result.get('details', {})
+        'valid': result.valid,
+        'message': result.message,
+        'details': result.details or {}
     }), 200
 
 
@@ -57,7 +55,7 @@ def validate_mcq():
         raise ValidationError("Invalid format. Provide MCQ array or object with 'mcqs' key.")
     
     # Validate using JSONFormatter which enforces the schema
-    formatter = JSONFormatter()
+    formatter = current_app.extensions['formatter']
     formatted_mcqs = formatter.format_mcq(mcqs)
     
     invalid_count = len(mcqs) - len(formatted_mcqs)
@@ -1,12 +1,21 @@
 """
 AI Processor service - handles MCQ extraction using GROQ API.
 """
+import hashlib
 import logging
 import os
 import json
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Create logger
 logger = logging.getLogger(__name__)
 
@@ -16,6 +25,98 @@ MIN_CHUNK_SIZE = 1500
 MAX_CHUNK_SIZE = 2500
 MAX_RETRIES = 2
 RATE_LIMIT_WAIT_TIME = 30  # seconds to wait when rate limited
+MAX_CONCURRENT_CHUNKS = 8  # parallel GROQ calls per extraction
+
+# Precompiled split patterns - blank-line paragraph boundaries keep a
+# question and its options together; the question-mark splitter is the
+# fallback for oversized paragraphs.
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+_QUESTION_SPLIT_RE = re.compile(r'(\?)')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# Fallback extractor for malformed LLM responses: individual flat JSON
+# objects (an MCQ has no nested braces) that can be parsed one by one
+# when the surrounding array is broken.
+_MCQ_OBJECT_RE = re.compile(r'\{[^{}]*\}')
+
+# Shared GROQ clients keyed by API key. Rebuilding the client per call
+# throws away its keep-alive HTTP connection pool, costing a TCP/TLS
+# handshake per chunk; caching lets worker threads reuse one session.
+_CLIENT_CACHE: Dict[str, Any] = {}
+
+# LRU cache of extraction results keyed by SHA-256 of the input text.
+# Re-uploading the same PDF (common in dev and question-bank workflows)
+# skips the full LLM round-trip entirely.
+_RESULT_CACHE: 'OrderedDict[str, List[Dict[str, Any]]]' = OrderedDict()
+_RESULT_CACHE_SIZE = 256
+_RESULT_CACHE_LOCK = threading.Lock()
+
+# Single-flight registry: extractions currently running, keyed by the
+# same text hash as the result cache. Concurrent requests for identical
+# text wait on the first caller's future instead of launching duplicate
+# LLM calls inside its latency window.
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Static instruction block of the extraction prompt. Built once so each
+# chunk only pays for one string concatenation instead of re-formatting
+# the whole multi-KB template.
+_EXTRACTION_PROMPT_PREFIX = """Extract all MCQs from the text as a JSON array.
+
+IMPORTANT REQUIREMENTS - READ CAREFULLY:
+
+1. EACH OPTION MUST CONTAIN THE FULL ANSWER TEXT, NEVER JUST LETTERS:
+   - WRONG: "options": ["A", "B", "C", "D"]
+   - RIGHT: "options": ["Paris", "London", "Berlin", "Madrid"]
+
+2. REMOVE OPTION LABELS from option text:
+   - Input: "A) Paris" → Output: "Paris"
+   - Input: "(B) London" → Output: "London"
+   - Input: "C. Berlin" → Output: "Berlin"
+   - Input: "(D) Madrid" → Output: "Madrid"
+
+3. SUPPORTED MCQ FORMATS:
+   - Standard: "1. Question? A) Apple B) Banana C) Cherry D) Date"
+   - Inline: "(A) Apple (B) Banana (C) Cherry (D) Date"
+   - Table: Extract all rows as options
+   - Multiline: Each option on new line
+
+4. CORRECT ANSWER - MUST be an integer index (0-3):
+   - Index mapping: 0=A, 1=B, 2=C, 3=D
+   - If correct answer text is given (e.g., "Answer: B" or "*B" or "Answer: Paris"), find which option it matches and use its index
+   - If NO explicit correct answer is given, INFER it using basic knowledge reasoning
+
+5. WHEN INFERENCING CORRECT ANSWER:
+   - Use logical reasoning to determine the most likely correct answer
+   - Example: "What is 2+2?" options: ["3", "4", "5", "6"] → correct_answer: 1 (index of "4")
+
+6. ALWAYS RETURN EXACTLY 4 OPTIONS per question
+
+7. If you cannot determine the correct answer, you may set correct_answer to null but still include the MCQ
+
+Format (STRICTLY follow this JSON structure):
+[{"question": "What is the capital of France?", "options": ["Paris", "London", "Berlin", "Madrid"], "correct_answer": 0}]
+
+IMPORTANT: Output ONLY valid JSON array, no additional text.
+
+Text to extract from:
+"""
+
+
+def _json_loads(text: str):
+    """Parse JSON with orjson's C parser when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _get_groq_client(api_key: str):
+    """Return the shared Groq client for this API key."""
+    client = _CLIENT_CACHE.get(api_key)
+    if client is None:
+        from groq import Groq
+        client = _CLIENT_CACHE.setdefault(api_key, Groq(api_key=api_key))
+    return client
 
 
 class AIProcessor:
@@ -40,7 +141,43 @@ class AIProcessor:
         if not self.api_key:
             logger.warning("No GROQ_API_KEY found, using mock data")
             return self._get_mock_mcqs()
-        
+
+        # Serve repeat extractions of identical text from the LRU cache
+        cache_key = hashlib.sha256(text.encode()).hexdigest()
+        with _RESULT_CACHE_LOCK:
+            cached = _RESULT_CACHE.get(cache_key)
+            if cached is not None:
+                _RESULT_CACHE.move_to_end(cache_key)
+                logger.info("Returning cached extraction for identical text")
+                return list(cached)
+
+        # Single-flight: the first caller for this text runs the
+        # extraction; concurrent callers block on its future and share
+        # the result rather than issuing duplicate GROQ calls.
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                _INFLIGHT[cache_key] = future
+
+        if not is_owner:
+            logger.info("Waiting on in-flight extraction for identical text")
+            return list(future.result())
+
+        try:
+            result = self._extract_uncached(text, cache_key)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _INFLIGHT_LOCK:
+                _INFLIGHT.pop(cache_key, None)
+
+    def _extract_uncached(self, text: str, cache_key: str) -> List[Dict[str, Any]]:
+        """Run the chunked extraction pipeline and populate the LRU cache."""
         # Split text into intelligent chunks (1500-2500 chars)
         chunks = self._split_text_intelligently(text)
         logger.info("Split text into %d chunks for processing", len(chunks))
@@ -48,11 +185,20 @@ class AIProcessor:
         if not chunks:
             return []
         
-        # Process each chunk and collect MCQs
+        # Process chunks concurrently - each call is network-bound LLM
+        # latency, so wall time collapses from sum to roughly
+        # max(chunk_latency). executor.map preserves chunk order.
+        if len(chunks) == 1:
+            chunk_results = [self._extract_from_text(chunks[0], 0)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), MAX_CONCURRENT_CHUNKS)) as executor:
+                chunk_results = list(executor.map(
+                    lambda item: self._extract_from_text(item[1], item[0]),
+                    enumerate(chunks)
+                ))
+
         all_mcqs = []
-        for i, chunk in enumerate(chunks):
-            logger.info("Processing chunk %d/%d (%d chars)", i+1, len(chunks), len(chunk))
-            mcqs = self._extract_from_text(chunk, i)
+        for i, mcqs in enumerate(chunk_results):
             if mcqs:
                 logger.info("Extracted %d MCQs from chunk %d", len(mcqs), i+1)
                 all_mcqs.extend(mcqs)
@@ -60,7 +206,13 @@ class AIProcessor:
         # Merge and deduplicate MCQs while maintaining order
         merged_mcqs = self._merge_and_deduplicate_mcqs(all_mcqs)
         logger.info("Final MCQ count after deduplication: %d", len(merged_mcqs))
-        
+
+        if merged_mcqs:
+            with _RESULT_CACHE_LOCK:
+                _RESULT_CACHE[cache_key] = merged_mcqs
+                if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+                    _RESULT_CACHE.popitem(last=False)
+
         return merged_mcqs
     
     def _split_text_intelligently(self, text: str) -> List[str]:
@@ -74,9 +226,13 @@ class AIProcessor:
         chunks = []
         current_chunk = []
         current_length = 0
-        
-        # Split by paragraphs first to preserve structure
-        paragraphs = text.split('\n')
+
+        # Split at blank-line paragraph boundaries first so a question and
+        # its options (which span single newlines) stay in one piece.
+        # Fall back to line splitting when the text has no blank lines.
+        paragraphs = _PARAGRAPH_RE.split(text)
+        if len(paragraphs) == 1:
+            paragraphs = text.split('\n')
         
         for paragraph in paragraphs:
             paragraph = paragraph.strip()
@@ -89,7 +245,7 @@ class AIProcessor:
             if paragraph_length > MAX_CHUNK_SIZE:
                 # Save current accumulated content
                 if current_chunk:
-                    chunks.append(' '.join(current_chunk))
+                    chunks.append('\n'.join(current_chunk))
                     current_chunk = []
                     current_length = 0
                 
@@ -102,7 +258,7 @@ class AIProcessor:
             if current_length + paragraph_length + 1 > MAX_CHUNK_SIZE:
                 # Save current chunk if it meets minimum size
                 if current_length >= MIN_CHUNK_SIZE:
-                    chunks.append(' '.join(current_chunk))
+                    chunks.append('\n'.join(current_chunk))
                 else:
                     # Add to next chunk if current is too small
                     if current_chunk:
@@ -119,11 +275,13 @@ class AIProcessor:
         
         # Don't forget the last chunk
         if current_chunk and current_length > 0:
-            chunks.append(' '.join(current_chunk))
-        
-        # Filter out empty chunks and strip whitespace
-        chunks = [chunk.strip() for chunk in chunks if chunk.strip()]
-        
+            chunks.append('\n'.join(current_chunk))
+
+        # No final strip/filter pass: every chunk is joined from
+        # already-stripped non-empty paragraphs (and _split_large_paragraph
+        # strips its output), so re-stripping here would just copy every
+        # chunk string again.
+
         logger.debug("Created %d chunks from %d characters", len(chunks), len(text))
         return chunks
     
@@ -132,7 +290,7 @@ class AIProcessor:
         chunks = []
         
         # Try to split at question marks first (MCQ boundaries)
-        sentences = re.split(r'(\?)', paragraph)
+        sentences = _QUESTION_SPLIT_RE.split(paragraph)
         
         current_chunk = []
         current_length = 0
@@ -196,7 +354,9 @@ class AIProcessor:
         for attempt in range(MAX_RETRIES):
             try:
                 mcqs = self._call_groq_api(text, chunk_index)
-                if mcqs and len(mcqs) > 0:
+                # _parse_response already filtered entries through
+                # _clean_mcq, so the parse result needs no re-validation
+                if mcqs:
                     # Add chunk index to help with ordering
                     for mcq in mcqs:
                         mcq['_chunk_index'] = chunk_index
@@ -209,11 +369,10 @@ class AIProcessor:
     
     def _call_groq_api(self, text: str, chunk_index: int = 0) -> List[Dict[str, Any]]:
         """Call GROQ API and parse response."""
-        from groq import Groq
         import httpx
-        
-        client = Groq(api_key=self.api_key)
-        
+
+        client = _get_groq_client(self.api_key)
+
         prompt = self._create_extraction_prompt(text)
         
         try:
@@ -249,70 +408,75 @@ class AIProcessor:
     
     def _create_extraction_prompt(self, text: str) -> str:
         """Create structured prompt for MCQ extraction."""
-        return f"""Extract all MCQs from the text as a JSON array.
-
-IMPORTANT REQUIREMENTS - READ CAREFULLY:
-
-1. EACH OPTION MUST CONTAIN THE FULL ANSWER TEXT, NEVER JUST LETTERS:
-   - WRONG: "options": ["A", "B", "C", "D"]
-   - RIGHT: "options": ["Paris", "London", "Berlin", "Madrid"]
-   
-2. REMOVE OPTION LABELS from option text:
-   - Input: "A) Paris" → Output: "Paris"
-   - Input: "(B) London" → Output: "London"  
-   - Input: "C. Berlin" → Output: "Berlin"
-   - Input: "(D) Madrid" → Output: "Madrid"
-
-3. SUPPORTED MCQ FORMATS:
-   - Standard: "1. Question? A) Apple B) Banana C) Cherry D) Date"
-   - Inline: "(A) Apple (B) Banana (C) Cherry (D) Date"
-   - Table: Extract all rows as options
-   - Multiline: Each option on new line
-
-4. CORRECT ANSWER - MUST be an integer index (0-3):
-   - Index mapping: 0=A, 1=B, 2=C, 3=D
-   - If correct answer text is given (e.g., "Answer: B" or "*B" or "Answer: Paris"), find which option it matches and use its index
-   - If NO explicit correct answer is given, INFER it using basic knowledge reasoning
-
-5. WHEN INFERENCING CORRECT ANSWER:
-   - Use logical reasoning to determine the most likely correct answer
-   - Example: "What is 2+2?" options: ["3", "4", "5", "6"] → correct_answer: 1 (index of "4")
-
-6. ALWAYS RETURN EXACTLY 4 OPTIONS per question
+        # The instruction block is a multi-KB constant; concatenating it
+        # once is cheaper than re-formatting the whole template per chunk
+        return _EXTRACTION_PROMPT_PREFIX + text
 
-7. If you cannot determine the correct answer, you may set correct_answer to null but still include the MCQ
-
-Format (STRICTLY follow this JSON structure):
-[{{"question": "What is the capital of France?", "options": ["Paris", "London", "Berlin", "Madrid"], "correct_answer": 0}}]
-
-IMPORTANT: Output ONLY valid JSON array, no additional text.
-
-Text to extract from:
-{text}"""
-    
     def _parse_response(self, response_text: str) -> List[Dict[str, Any]]:
         """Parse AI response to extract MCQs."""
         try:
-            # Find JSON array in response
-            start = response_text.find('[')
-            end = response_text.rfind(']') + 1
-            
-            if start == -1:
+            # Walk the text once, tracking bracket depth, and parse each
+            # balanced top-level [...] span. Unlike find('[')/rfind(']'),
+            # stray brackets in surrounding prose can't stretch the slice
+            # into invalid JSON, and each candidate is parsed exactly once.
+            depth = 0
+            start = -1
+            found_array = False
+            for i, ch in enumerate(response_text):
+                if ch == '[':
+                    if depth == 0:
+                        start = i
+                    depth += 1
+                elif ch == ']' and depth:
+                    depth -= 1
+                    if depth == 0:
+                        found_array = True
+                        try:
+                            mcqs = _json_loads(response_text[start:i + 1])
+                        except ValueError:
+                            continue
+                        if isinstance(mcqs, list):
+                            cleaned = [c for m in mcqs if (c := self._clean_mcq(m))]
+                            # Prose citations like "[1]" parse as valid
+                            # lists too; keep scanning until a candidate
+                            # actually yields MCQs
+                            if cleaned:
+                                return cleaned
+
+            if not found_array:
                 # Try parsing as JSON object with 'mcqs' or similar key
-                data = json.loads(response_text)
+                data = _json_loads(response_text)
                 # Find the array in the object
-                for key in data.values():
-                    if isinstance(key, list):
-                        mcqs = key
-                        return [self._clean_mcq(m) for m in mcqs if self._clean_mcq(m)]
+                for value in data.values():
+                    if isinstance(value, list):
+                        return [c for m in value if (c := self._clean_mcq(m))]
                 return []
-            
-            json_str = response_text[start:end]
-            mcqs = json.loads(json_str)
-            return [self._clean_mcq(m) for m in mcqs if self._clean_mcq(m)]
+
+            raise ValueError("no parseable JSON array in response")
         except Exception as e:
             logger.error("Parse error: %s", str(e))
-            return []
+            return self._recover_partial_mcqs(response_text)
+
+    def _recover_partial_mcqs(self, response_text: str) -> List[Dict[str, Any]]:
+        """
+        Salvage MCQs from a malformed response.
+
+        One truncated or broken element makes the whole array unparseable;
+        parsing each brace-delimited object independently recovers the
+        valid MCQs instead of discarding the entire chunk.
+        """
+        recovered = []
+        for match in _MCQ_OBJECT_RE.finditer(response_text):
+            try:
+                mcq = _json_loads(match.group())
+            except ValueError:
+                continue
+            cleaned = self._clean_mcq(mcq)
+            if cleaned:
+                recovered.append(cleaned)
+        if recovered:
+            logger.warning("Recovered %d MCQs from malformed response", len(recovered))
+        return recovered
     
     def _clean_mcq(self, mcq: Dict[str, Any]) -> Dict[str, Any]:
         """Clean and validate a single MCQ."""
@@ -527,12 +691,15 @@ Text to extract from:
                 continue
             
             # Create a unique key based on BOTH question AND options
-            # Normalize for comparison (case-insensitive, ignore punctuation)
+            # Normalize for comparison (case-insensitive, ignore punctuation).
+            # Only the hash of the key is stored: the set holds small ints
+            # instead of full normalized strings, so membership checks are
+            # cheap int compares and memory stays flat on large MCQ sets.
             normalized_question = self._normalize_for_comparison(question)
             normalized_options = '|'.join([self._normalize_for_comparison(str(opt)) for opt in options])
-            
-            mcq_key = f"{normalized_question}||{normalized_options}"
-            
+
+            mcq_key = hash((normalized_question, normalized_options))
+
             # Only skip if we've seen this exact question+options combination
             if mcq_key in seen_mcqs:
                 logger.debug(f"Skipping duplicate MCQ: {question[:50]}...")
@@ -559,7 +726,7 @@ Text to extract from:
         # Remove extra whitespace
         text = ' '.join(text.split())
         # Remove common punctuation that doesn't affect meaning
-        text = re.sub(r'[^\w\s]', '', text)
+        text = _PUNCTUATION_RE.sub('', text)
         return text.lower().strip()
     
     def _validate_mcqs(self, mcqs: List[Dict[str, Any]]) -> bool:
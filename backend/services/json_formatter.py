@@ -7,6 +7,11 @@ import re
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Create logger
 logger = logging.getLogger(__name__)
 
@@ -22,6 +27,11 @@ OPTION_PATTERNS = [
     r'^\s*[a-dA-D]\s+',
 ]
 
+# Whitespace collapse pattern for _clean_text - one regex pass instead
+# of split/join and per-character replace calls. \s already matches \r,
+# so carriage returns collapse to spaces like any other separator.
+_WHITESPACE_RE = re.compile(r'\s+')
+
 # Letter-only options that indicate AI failed to extract full text
 LETTER_ONLY_OPTIONS = {
     'a', 'b', 'c', 'd', 
@@ -173,35 +183,54 @@ class JSONFormatter:
         
         for mcq in mcqs:
             try:
+                # First-line dedup on the raw question text - duplicates
+                # repeated across chunks are dropped before paying for any
+                # _clean_text work on the question and options
+                raw_question = mcq.get('question', '')
+                raw_key = hash(str(raw_question).strip().lower())
+                if raw_key in seen_questions:
+                    logger.debug(f"Duplicate question found: {str(raw_question)[:50]}...")
+                    continue
+
                 # Parse the MCQ
-                question = self._clean_text(mcq.get('question', ''))
+                question = self._clean_text(raw_question)
                 raw_options = mcq.get('options', [])
-                
+
+                # Fewer than 4 raw options can never survive the exactly-4
+                # rule below - skip before paying for normalization
+                if len(raw_options) < 4:
+                    logger.warning(f"MCQ does not have exactly 4 options (found {len(raw_options)}), skipping")
+                    continue
+
                 # Normalize each option - remove labels like (A), A), A., etc.
                 options = []
                 for opt in raw_options:
                     normalized = self._normalize_option(str(opt))
                     if normalized:
                         options.append(normalized)
-                
+
                 # Get correct answer as index (0-3)
                 correct_answer = mcq.get('correct_answer')
-                
-                # Handle both int index and string answer
+
+                # Handle both int index and string answer - the int path
+                # comes first since it's what the extraction prompt asks for
                 if isinstance(correct_answer, int) and 0 <= correct_answer < len(options):
                     correct_index = correct_answer
                 elif isinstance(correct_answer, str):
-                    # Try to find the answer in options and get its index
+                    # Clean each option once and index it, instead of
+                    # re-cleaning the whole list per comparison scan
                     answer_text = self._clean_text(correct_answer).lower()
-                    correct_index = None
+                    option_index = {}
+                    options_lower = []
                     for idx, opt in enumerate(options):
-                        if self._clean_text(str(opt)).lower() == answer_text:
-                            correct_index = idx
-                            break
+                        opt_lower = self._clean_text(str(opt)).lower()
+                        options_lower.append(opt_lower)
+                        option_index.setdefault(opt_lower, idx)
+                    correct_index = option_index.get(answer_text)
                     if correct_index is None:
-                        # Try normalized match
-                        for idx, opt in enumerate(options):
-                            if answer_text in self._clean_text(str(opt)).lower():
+                        # Try partial match
+                        for idx, opt_lower in enumerate(options_lower):
+                            if answer_text in opt_lower:
                                 correct_index = idx
                                 break
                     if correct_index is None:
@@ -218,12 +247,16 @@ class JSONFormatter:
                     logger.warning(f"Invalid correct_answer value: {correct_answer}, skipping MCQ")
                     continue
                 
-                # Check for duplicates
-                question_key = question.lower().strip()
+                # Second-line dedup on the normalized question - catches
+                # duplicates whose raw text differed only in whitespace.
+                # The set stores hashes rather than full lowercased
+                # strings, keeping lookups and memory cheap
+                question_key = hash(question.lower().strip())
                 if question_key in seen_questions:
                     logger.debug(f"Duplicate question found: {question[:50]}...")
                     continue
                 seen_questions.add(question_key)
+                seen_questions.add(raw_key)
                 
                 # Validate: must have exactly 4 options
                 if len(options) != 4:
@@ -278,11 +311,10 @@ class JSONFormatter:
     def _clean_text(self, text: str) -> str:
         if not text:
             return ""
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        # Remove common artifacts
-        text = text.replace('\n', ' ').replace('\r', '')
-        return text.strip()
+        # Collapse all whitespace runs (including \r and \n) to a single
+        # space in one regex pass. Called five times per MCQ, so this is
+        # format_mcq's hottest helper.
+        return _WHITESPACE_RE.sub(' ', text).strip()
     
     def save_to_file(self, mcqs: List[Dict[str, Any]], filename: str, output_dir: Path) -> Path:
         """Save MCQs to a JSON file."""
@@ -290,9 +322,14 @@ class JSONFormatter:
             output_dir.mkdir(parents=True, exist_ok=True)
             file_path = output_dir / filename
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(mcqs, f, indent=2, ensure_ascii=False)
-            
+            # orjson serializes to bytes in C, several times faster than
+            # stdlib json on large MCQ lists
+            if orjson is not None:
+                file_path.write_bytes(orjson.dumps(mcqs, option=orjson.OPT_INDENT_2))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(mcqs, f, indent=2, ensure_ascii=False)
+
             logger.info(f"Saved {len(mcqs)} MCQs to {file_path}")
             return file_path
             
@@ -303,9 +340,12 @@ class JSONFormatter:
     def load_from_file(self, file_path: Path) -> List[Dict[str, Any]]:
         """Load MCQs from a JSON file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                mcqs = json.load(f)
-            
+            if orjson is not None:
+                mcqs = orjson.loads(Path(file_path).read_bytes())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    mcqs = json.load(f)
+
             if isinstance(mcqs, dict) and 'mcqs' in mcqs:
                 mcqs = mcqs['mcqs']
             
@@ -1,32 +1,335 @@
 """
 PDF Reader service - handles reading PDF files.
 """
+import hashlib
 import logging
-import re
-from typing import Any, List, Tuple
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
 from pathlib import Path
-from io import BytesIO
 
 # Create logger
 logger = logging.getLogger(__name__)
 
+# OCR worker processes. Tesseract is CPU-bound and holds its own locks,
+# so pages are fanned out across processes rather than threads; it also
+# uses ~4 cores per invocation, hence cpu_count()//4 by default.
+OCR_MAX_WORKERS = int(os.getenv('OCR_CONCURRENCY', 0)) or (os.cpu_count() or 4) // 4 or 1
+
+# Render DPI for OCR. Tesseract time scales with pixel area, so pdf2image's
+# 200 DPI default costs ~1.8x the pixels of 150 DPI, which is enough for
+# ordinary text scans; raise OCR_DPI for small-print documents. Pages are
+# additionally capped at this edge length before recognition.
+OCR_DPI = int(os.getenv('OCR_DPI', 150))
+OCR_MAX_DIMENSION = 2000
+
+# Parallel text extraction for long text-based PDFs. pdfminer is pure
+# Python (threads would serialize on the GIL) and a pdfplumber handle is
+# not safe to share across workers, so each worker opens its own
+# single-page window. Only worth the reopen overhead past this many pages.
+PDF_PAGE_WORKERS = int(os.getenv('PDF_PAGE_CONCURRENCY', 0)) or (os.cpu_count() or 1)
+PARALLEL_PAGE_THRESHOLD = 16
+
+# is_scanned treats a sampled page as textual once it yields this many
+# characters; below it across all sampled pages (stray OCR artifacts,
+# page numbers) the document still counts as scanned.
+SCANNED_TEXT_THRESHOLD = 50
+
+# Fold the rarer whitespace characters into plain spaces in one C-level
+# translate pass, so splitlines below only ever breaks on '\n' (it would
+# otherwise also split on \v, \f and \r) and split() only has spaces to
+# collapse.
+_WS_TRANS = str.maketrans({'\t': ' ', '\r': ' ', '\v': ' ', '\f': ' '})
+
+
+def _page_text(page) -> str:
+    """
+    Extract a page's text with the cheapest pdfplumber call available.
+
+    extract_text_simple skips the word-grouping layout analysis that
+    extract_text performs per page - MCQ extraction only needs reading-
+    order text, not layout fidelity. Falls back to the full extractor
+    on older pdfplumber or pages the simple walker chokes on.
+    """
+    try:
+        return page.extract_text_simple() or ''
+    except Exception:
+        return page.extract_text() or ''
+
+
+def _extract_page_window(args) -> str:
+    """Extract one page's text in a worker via a single-page window."""
+    file_path, page_number, text_only = args
+    import pdfplumber
+    try:
+        with pdfplumber.open(file_path, pages=[page_number]) as pdf:
+            if text_only:
+                return _page_text(pdf.pages[0])
+            return pdf.pages[0].extract_text() or ''
+    except Exception:
+        return ''
+
+# LRU of extracted document text keyed by (path, mtime_ns, size), so a
+# re-extraction of the same stored PDF skips parsing entirely; an
+# overwrite changes mtime/size and misses. Entries hold (text,
+# page_count). In-memory like the OCR and AI-result caches - a disk
+# cache would only duplicate the JSON result cache the routes keep.
+_TEXT_CACHE: 'OrderedDict[tuple, Tuple[str, Optional[int]]]' = OrderedDict()
+_TEXT_CACHE_SIZE = 32
+_TEXT_CACHE_LOCK = threading.Lock()
+
+
+def _text_cache_key(file_path) -> Optional[tuple]:
+    """Build the (path, mtime_ns, size) cache key, or None if unstattable."""
+    try:
+        st = os.stat(file_path)
+        return (str(file_path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _text_cache_get(key: Optional[tuple]) -> Optional[Tuple[str, Optional[int]]]:
+    if key is None:
+        return None
+    with _TEXT_CACHE_LOCK:
+        entry = _TEXT_CACHE.get(key)
+        if entry is not None:
+            _TEXT_CACHE.move_to_end(key)
+        return entry
+
+
+def _text_cache_put(key: Optional[tuple], text: str, page_count: Optional[int]):
+    if key is None:
+        return
+    with _TEXT_CACHE_LOCK:
+        _TEXT_CACHE[key] = (text, page_count)
+        if len(_TEXT_CACHE) > _TEXT_CACHE_SIZE:
+            _TEXT_CACHE.popitem(last=False)
+
+
+# Content-addressed LRU of OCR results keyed by page-image hash. A hash
+# lookup is ~1 ms against 50-250 ms per Tesseract call, so re-uploads
+# and documents with repeated pages skip OCR entirely. Whole-document
+# results for the bytes path are stored in the same table.
+_OCR_CACHE: 'OrderedDict[str, str]' = OrderedDict()
+_OCR_CACHE_SIZE = 512
+_OCR_CACHE_LOCK = threading.Lock()
+
+
+def _ocr_cache_key(image) -> Optional[str]:
+    """Hash a rendered page (path or PIL image) for the OCR cache."""
+    try:
+        if isinstance(image, (str, Path)):
+            data = Path(image).read_bytes()
+        else:
+            data = image.tobytes()
+        return hashlib.blake2b(data, digest_size=16).hexdigest() + ':eng'
+    except Exception:
+        return None
+
+
+def _ocr_cache_get(key: Optional[str]) -> Optional[str]:
+    if key is None:
+        return None
+    with _OCR_CACHE_LOCK:
+        text = _OCR_CACHE.get(key)
+        if text is not None:
+            _OCR_CACHE.move_to_end(key)
+        return text
+
+
+def _ocr_cache_put(key: Optional[str], text: str):
+    if key is None:
+        return
+    with _OCR_CACHE_LOCK:
+        _OCR_CACHE[key] = text
+        if len(_OCR_CACHE) > _OCR_CACHE_SIZE:
+            _OCR_CACHE.popitem(last=False)
+
+
+# Per-process persistent tesserocr API. pytesseract forks a tesseract
+# subprocess and reloads traineddata on every call (~200-600 ms of fixed
+# overhead per page); tesserocr keeps one engine loaded for the life of
+# the process. False marks tesserocr as unavailable. The engine is not
+# thread-safe, so the serial OCR path (which runs on Flask request
+# threads) serializes SetImage/GetUTF8Text pairs under a lock; pool
+# workers each get their own process and never contend.
+_tess_api = None
+_TESS_API_LOCK = threading.Lock()
+
+
+# MCQ documents are uniform single-column text: psm 6 skips per-page
+# orientation/segmentation analysis and oem 1 runs the LSTM engine only
+# instead of legacy+LSTM. preserve_interword_spaces keeps option columns
+# aligned for the downstream parsers.
+TESSERACT_CONFIG = '--psm 6 --oem 1 -c preserve_interword_spaces=1'
+
+
+def _get_tess_api():
+    """Lazily create this process's persistent tesserocr engine, if any."""
+    global _tess_api
+    with _TESS_API_LOCK:
+        if _tess_api is None:
+            try:
+                from tesserocr import OEM, PSM, PyTessBaseAPI
+                _tess_api = PyTessBaseAPI(
+                    lang='eng', psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+                _tess_api.SetVariable('preserve_interword_spaces', '1')
+            except Exception:
+                _tess_api = False
+    return _tess_api or None
+
+
+@lru_cache(maxsize=1)
+def _ocr_available() -> bool:
+    """
+    Check if OCR (pytesseract) is available.
+
+    get_tesseract_version forks a subprocess to run tesseract --version;
+    the answer cannot change while the process runs, so probe once and
+    cache it instead of paying the fork on every OCR attempt and every
+    no-OCR error path.
+    """
+    try:
+        import pytesseract
+        pytesseract.get_tesseract_version()
+        logger.info("OCR (pytesseract) is available")
+        return True
+    except ImportError:
+        logger.warning("pytesseract is not installed. Run: pip install pytesseract")
+        return False
+    except Exception as e:
+        logger.warning(f"OCR not available: {str(e)}")
+        return False
+
+
+def _preprocess_page(image):
+    """
+    Grayscale, normalize contrast and binarize a page before OCR.
+    Tesseract's LSTM runs faster and produces fewer garbage tokens on
+    clean black-on-white input than on noisy grayscale scans.
+    """
+    from PIL import ImageOps
+    if max(image.size) > OCR_MAX_DIMENSION:
+        # Bound the worst case: halving pixel count roughly halves
+        # Tesseract time, and 2000 px is ample for a text page
+        image.thumbnail((OCR_MAX_DIMENSION, OCR_MAX_DIMENSION))
+    image = ImageOps.grayscale(image)
+    image = ImageOps.autocontrast(image)
+    return image.point(lambda p: 255 if p > 160 else 0)
+
+
+def _ocr_one(image) -> str:
+    """
+    OCR one rendered page - a PIL image or a path to an image file.
+    Module-level so pool workers can pickle it.
+    """
+    if isinstance(image, (str, Path)):
+        from PIL import Image
+        with Image.open(image) as img:
+            return _ocr_image(_preprocess_page(img))
+    return _ocr_image(_preprocess_page(image))
+
+
+def _ocr_image(image) -> str:
+    """Run the loaded page image through the available OCR engine."""
+    api = _get_tess_api()
+    if api is not None:
+        # Two request threads interleaving SetImage/GetUTF8Text on the
+        # shared engine corrupt each other's output
+        with _TESS_API_LOCK:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+
+    import pytesseract
+    return pytesseract.image_to_string(image, lang='eng', config=TESSERACT_CONFIG)
+
 
 class PDFReadError(Exception):
     """Custom exception for PDF reading errors."""
-    pass
+    # No per-instance attributes beyond Exception.args, so skip the dict
+    __slots__ = ()
 
 
 class PDFNoTextError(Exception):
     """Custom exception raised when no text is found in PDF."""
-    pass
+    __slots__ = ()
 
 
 class PDFReader:
     """Handles reading and extracting text from PDF files."""
     
-    def __init__(self):
-        """Initialize PDF reader."""
+    def __init__(self, max_workers: Optional[int] = None, text_only: bool = True,
+                 sample_pages: int = 3):
+        """
+        Initialize PDF reader.
+
+        Args:
+            max_workers: Cap on page-extraction worker processes.
+                Defaults to the PDF_PAGE_CONCURRENCY env setting or the
+                CPU count.
+            text_only: Use the fast text-only page walker (default).
+                Pass False to run pdfplumber's full layout analysis per
+                page when word positioning matters more than speed.
+            sample_pages: Number of leading pages is_scanned inspects.
+        """
+        self.max_workers = max_workers or PDF_PAGE_WORKERS
+        self.text_only = text_only
+        self.sample_pages = sample_pages
+        # Page counts keyed by (path, mtime_ns) - get_page_count is often
+        # called alongside the extraction methods on the same file, and
+        # each call otherwise reopens and parses the xref table
+        self._pagecount_cache: dict = {}
+        # Document handle held open by the open() context manager so
+        # consecutive method calls on the same file share one parse
+        self._doc = None
+        self._doc_path: Optional[str] = None
         logger.info("PDF Reader initialized")
+
+    @contextmanager
+    def open(self, file_path: str):
+        """
+        Hold one parsed document open across several method calls.
+
+        read_pdf, extract_page_text, get_page_count and is_scanned each
+        open and parse the file per call; inside this context they reuse
+        the held handle instead, so a read_pdf + extract_page_text pair
+        parses the xref table once:
+
+            with reader.open(path) as r:
+                text = r.read_pdf(path)
+                first = r.extract_page_text(path, 1)
+
+        The handle lives on the instance, so don't share one PDFReader
+        across threads while a handle is open - use a local reader.
+        """
+        try:
+            import pdfplumber
+        except ImportError:
+            raise PDFReadError("PDF processing library not available. Please install pdfplumber: pip install pdfplumber")
+        try:
+            pdf = pdfplumber.open(file_path)
+        except Exception as e:
+            logger.exception(f"Error opening PDF: {str(e)}")
+            raise PDFReadError(f"Failed to read PDF: {str(e)}")
+        self._doc = pdf
+        self._doc_path = str(file_path)
+        try:
+            yield self
+        finally:
+            self._doc = None
+            self._doc_path = None
+            pdf.close()
+
+    def _held_doc(self, file_path) -> Optional[Any]:
+        """Return the open()-held document if it matches file_path."""
+        if self._doc is not None and str(file_path) == self._doc_path:
+            return self._doc
+        return None
     
     def read_pdf(self, file_or_path) -> str:
         """
@@ -51,9 +354,23 @@ class PDFReader:
         try:
             # Check if it's a file path or file object
             if hasattr(file_or_path, 'read'):
+                # Spooled uploads land on unique temp paths, so the
+                # text cache would never hit - skip it
                 return self._read_pdf_from_file_object(file_or_path)
+
+            cache_key = _text_cache_key(file_or_path)
+            cached = _text_cache_get(cache_key)
+            if cached is not None:
+                logger.info("Text cache hit for %s", file_or_path)
+                return cached[0]
+
+            held = self._held_doc(file_or_path)
+            if held is not None:
+                text = self._read_open_pdf(held, str(file_or_path))
             else:
-                return self._read_pdf_from_path(file_or_path)
+                text = self._read_pdf_from_path(file_or_path)
+            _text_cache_put(cache_key, text, None)
+            return text
                 
         except (PDFNoTextError, FileNotFoundError):
             raise
@@ -61,117 +378,209 @@ class PDFReader:
             logger.exception(f"Error reading PDF: {str(e)}")
             raise PDFReadError(f"Failed to read PDF: {str(e)}")
     
+    def read_pdf_iter(self, file_path, start: int = 1, end: Optional[int] = None,
+                      batch_size: int = 500):
+        """
+        Yield cleaned per-page text from a PDF in bounded page windows.
+
+        read_pdf keeps the whole document's pages (and their parsed
+        layout) reachable at once, which swaps on multi-thousand-page
+        files. This variant opens at most batch_size pages per window,
+        so peak memory is the window size times the per-page working
+        set regardless of document length.
+
+        Args:
+            file_path: Path to the PDF file
+            start: First page to read (1-indexed)
+            end: Last page to read inclusive, or None for the final page
+            batch_size: Pages held open per window
+
+        Returns:
+            Generator of cleaned page texts, in page order
+
+        Raises:
+            PDFReadError: If the PDF cannot be opened (raised before
+                iteration begins)
+        """
+        try:
+            import pdfplumber
+        except ImportError:
+            logger.error("pdfplumber is not installed")
+            raise PDFReadError("PDF processing library not available. Please install pdfplumber: pip install pdfplumber")
+
+        # Validate eagerly so a bad path fails at the call site, not on
+        # the first next()
+        page_count = self.get_page_count(file_path)
+        if page_count == 0:
+            raise PDFReadError(f"Failed to read PDF: {file_path}")
+
+        first = max(start, 1)
+        last = page_count if end is None else min(end, page_count)
+
+        def _pages():
+            for window_start in range(first, last + 1, batch_size):
+                window_end = min(window_start + batch_size - 1, last)
+                with pdfplumber.open(
+                    file_path, pages=list(range(window_start, window_end + 1))
+                ) as pdf:
+                    yield from self._extract_text_by_page(pdf)
+
+        return _pages()
+
     def _read_pdf_from_path(self, file_path: str) -> str:
         """Read PDF from file path."""
         import pdfplumber
-        
+
         with pdfplumber.open(file_path) as pdf:
-            logger.info(f"Opened PDF with {len(pdf.pages)} pages")
+            return self._read_open_pdf(pdf, file_path)
+
+    def _read_open_pdf(self, pdf, file_path: str) -> str:
+        """Extract text from an already-opened pdfplumber PDF, falling
+        back to OCR against the on-disk file."""
+        page_count = len(pdf.pages)
+        logger.info(f"Opened PDF with {page_count} pages")
+        if self._probe_is_scanned(pdf):
+            # Image-only scan: skip the doomed full-document text pass
+            # and drop straight into the OCR fallback below
+            logger.info("First pages are image-only, going straight to OCR")
+            text_content = []
+        elif page_count >= PARALLEL_PAGE_THRESHOLD and self.max_workers > 1:
+            text_content = self._extract_text_parallel(file_path, page_count)
+        else:
             text_content = self._extract_text_by_page(pdf)
-            
-            if not text_content:
-                logger.warning("PDF appears to be empty, trying OCR...")
-                ocr_text = self._extract_text_using_ocr(file_path)
-                if ocr_text:
-                    logger.info(f"OCR extracted {len(ocr_text)} characters from PDF")
-                    return self._clean_text(ocr_text)
-                
-                # Try extracting images from PDF and OCR them
-                logger.warning("No text from page OCR, trying image extraction...")
-                images = self._extract_images_from_pdf(file_path)
-                if images:
-                    image_text = self._extract_text_from_images(images)
-                    if image_text:
-                        logger.info(f"Image OCR extracted {len(image_text)} characters from PDF")
-                        return self._clean_text(image_text)
-                
-                # Detailed error message for user
-                ocr_available = self._check_ocr_available()
-                if not ocr_available:
-                    raise PDFNoTextError(
-                        "No text found in PDF. The PDF appears to be scanned/image-based. "
-                        "OCR support is not installed. Please install: pip install pytesseract pdf2image "
-                        "And also install Tesseract OCR on your system."
-                    )
-                else:
-                    raise PDFNoTextError(
-                        "No text found in PDF. The PDF appears to be scanned/image-based. "
-                        "OCR extraction failed. Please ensure Tesseract OCR is installed on your system."
-                    )
-            
-            full_text = '\n'.join(text_content)
-            clean_text = self._clean_text(full_text)
-            logger.info(f"Extracted {len(clean_text)} characters from PDF")
-            return clean_text
-    
+
+        if not text_content:
+            logger.warning("PDF appears to be empty, trying OCR...")
+            ocr_text = self._extract_text_using_ocr(file_path)
+            if ocr_text:
+                logger.info(f"OCR extracted {len(ocr_text)} characters from PDF")
+                return self._clean_text(ocr_text)
+
+            # Try extracting images from PDF and OCR them
+            logger.warning("No text from page OCR, trying image extraction...")
+            images = self._extract_images_from_pdf(file_path)
+            if images:
+                image_text = self._extract_text_from_images(images)
+                if image_text:
+                    logger.info(f"Image OCR extracted {len(image_text)} characters from PDF")
+                    return self._clean_text(image_text)
+
+            # Detailed error message for user
+            ocr_available = self._check_ocr_available()
+            if not ocr_available:
+                raise PDFNoTextError(
+                    "No text found in PDF. The PDF appears to be scanned/image-based. "
+                    "OCR support is not installed. Please install: pip install pytesseract pdf2image "
+                    "And also install Tesseract OCR on your system."
+                )
+            else:
+                raise PDFNoTextError(
+                    "No text found in PDF. The PDF appears to be scanned/image-based. "
+                    "OCR extraction failed. Please ensure Tesseract OCR is installed on your system."
+                )
+
+        # Pages are already cleaned individually
+        clean_text = '\n'.join(text_content)
+        logger.info(f"Extracted {len(clean_text)} characters from PDF")
+        return clean_text
+
     def _read_pdf_from_file_object(self, file) -> str:
-        """Read PDF from file object."""
-        import pdfplumber
-        
-        file_content = file.read()
-        pdf_file = BytesIO(file_content)
-        
-        with pdfplumber.open(pdf_file) as pdf:
-            logger.info(f"Opened PDF with {len(pdf.pages)} pages")
-            text_content = self._extract_text_by_page(pdf)
-            
-            if not text_content:
-                logger.warning("PDF appears to be empty, trying OCR...")
-                ocr_text = self._extract_text_using_ocr_from_bytes(file_content)
-                if ocr_text:
-                    logger.info(f"OCR extracted {len(ocr_text)} characters from PDF")
-                    return self._clean_text(ocr_text)
-                
-                # Detailed error message for user
-                ocr_available = self._check_ocr_available()
-                if not ocr_available:
-                    raise PDFNoTextError(
-                        "No text found in PDF. The PDF appears to be scanned/image-based. "
-                        "OCR support is not installed. Please install: pip install pytesseract pdf2image "
-                        "And also install Tesseract OCR on your system."
-                    )
-                else:
-                    raise PDFNoTextError(
-                        "No text found in PDF. The PDF appears to be scanned/image-based. "
-                        "OCR extraction failed. Please ensure Tesseract OCR is installed on your system."
-                    )
-            
-            full_text = '\n'.join(text_content)
-            clean_text = self._clean_text(full_text)
-            logger.info(f"Extracted {len(clean_text)} characters from PDF")
-            return clean_text
+        """
+        Read PDF from file object.
+
+        The upload is spooled to a temporary file instead of read into a
+        BytesIO - a large scan no longer lives in RAM alongside the
+        parser's working set, and the OCR fallback renders straight from
+        the on-disk file rather than a bytes copy.
+        """
+        import shutil
+        import tempfile
+
+        fd, tmp_path = tempfile.mkstemp(suffix='.pdf')
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                shutil.copyfileobj(file, tmp_file, length=1024 * 1024)
+            return self._read_pdf_from_path(tmp_path)
+        finally:
+            os.unlink(tmp_path)
     
     def _extract_text_by_page(self, pdf) -> List[str]:
-        """Extract text from PDF page by page."""
+        """
+        Extract text from PDF page by page.
+
+        Pages are cleaned individually - small strings are cheaper to
+        normalize than one document-sized buffer, and the caller can
+        join the result once without a second cleaning pass.
+        """
         text_pages = []
-        
+
+        # %-style args so logging defers formatting when the level is
+        # filtered - f-strings would format once per page regardless
         for page_num, page in enumerate(pdf.pages, start=1):
             try:
-                text = page.extract_text()
-                if text and text.strip():
+                if self.text_only:
+                    raw = _page_text(page)
+                else:
+                    raw = page.extract_text() or ''
+                text = self._clean_text(raw)
+                if text:
                     text_pages.append(text)
-                    logger.debug(f"Extracted {len(text)} chars from page {page_num}")
+                    logger.debug("Extracted %d chars from page %d", len(text), page_num)
                 else:
-                    logger.warning(f"Page {page_num} contains no extractable text")
+                    logger.debug("Page %d contains no extractable text", page_num)
             except Exception as e:
-                logger.warning(f"Error extracting text from page {page_num}: {str(e)}")
+                logger.warning("Error extracting text from page %d: %s", page_num, str(e))
                 continue
-        
+            finally:
+                # Release this page's cached layout objects; without
+                # this, pdfplumber keeps every parsed page in memory and
+                # RSS grows linearly with page count on 1000+ page PDFs
+                page.flush_cache()
+
+        logger.info("Extracted text from %d of %d pages", len(text_pages), len(pdf.pages))
         return text_pages
     
+    def _probe_is_scanned(self, pdf) -> bool:
+        """
+        Cheaply decide whether a PDF is an image-only scan by probing
+        the first two pages: no extractable text but images present.
+        Anything ambiguous returns False so the full pass decides.
+        """
+        if not pdf.pages:
+            return False
+        for page in pdf.pages[:2]:
+            try:
+                text = page.extract_text()
+                has_images = bool(page.images)
+            except Exception:
+                return False
+            finally:
+                page.flush_cache()
+            if text and text.strip():
+                return False
+            if not has_images:
+                return False
+        return True
+
+    def _extract_text_parallel(self, file_path: str, page_count: int) -> List[str]:
+        """
+        Extract text from a long PDF with one process per page window.
+        executor.map preserves page order; cleaning happens in the
+        parent like the serial path.
+        """
+        workers = min(self.max_workers, page_count)
+        logger.info(f"Extracting {page_count} pages with {workers} workers...")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            raw_texts = executor.map(
+                _extract_page_window,
+                [(file_path, page_number, self.text_only)
+                 for page_number in range(1, page_count + 1)]
+            )
+            return [text for text in (self._clean_text(raw) for raw in raw_texts) if text]
+
     def _check_ocr_available(self) -> bool:
         """Check if OCR (pytesseract) is available."""
-        try:
-            import pytesseract
-            pytesseract.get_tesseract_version()
-            logger.info("OCR (pytesseract) is available")
-            return True
-        except ImportError:
-            logger.warning("pytesseract is not installed. Run: pip install pytesseract")
-            return False
-        except Exception as e:
-            logger.warning(f"OCR not available: {str(e)}")
-            return False
+        return _ocr_available()
     
     def _extract_images_from_pdf(self, file_path: str) -> List:
         """Extract images from PDF pages."""
@@ -201,9 +610,9 @@ class PDFReader:
                                 
                                 if pil_image:
                                     images.append(pil_image)
-                                    logger.debug(f"Extracted image from page {page_num}")
+                                    logger.debug("Extracted image from page %d", page_num)
                             except Exception as e:
-                                logger.debug(f"Could not extract image: {e}")
+                                logger.debug("Could not extract image: %s", e)
                                 continue
             
             logger.info(f"Extracted {len(images)} images from PDF")
@@ -227,13 +636,13 @@ class PDFReader:
             text_pages = []
             for img_num, image in enumerate(images, start=1):
                 try:
-                    logger.info(f"Processing image {img_num} with OCR...")
-                    text = pytesseract.image_to_string(image, lang='eng')
+                    logger.debug("Processing image %d with OCR...", img_num)
+                    text = pytesseract.image_to_string(image, lang='eng', config=TESSERACT_CONFIG)
                     if text and text.strip():
                         text_pages.append(text)
-                        logger.debug(f"OCR extracted {len(text)} chars from image {img_num}")
+                        logger.debug("OCR extracted %d chars from image %d", len(text), img_num)
                 except Exception as e:
-                    logger.warning(f"OCR failed for image {img_num}: {e}")
+                    logger.warning("OCR failed for image %d: %s", img_num, e)
                     continue
             
             if text_pages:
@@ -246,6 +655,33 @@ class PDFReader:
             logger.error(f"OCR extraction failed: {e}")
             return ""
     
+    def _ocr_images(self, images: List) -> List[str]:
+        """
+        Run Tesseract over rendered page images, in parallel when there
+        is more than one page. Pages are independent, so they fan out
+        across a process pool; executor.map preserves page order.
+        """
+        # Serve pages whose image content was OCR'd before from the cache
+        keys = [_ocr_cache_key(image) for image in images]
+        results: List[Optional[str]] = [_ocr_cache_get(key) for key in keys]
+        misses = [i for i, text in enumerate(results) if text is None]
+        if len(misses) < len(images):
+            logger.info(f"OCR cache served {len(images) - len(misses)} of {len(images)} pages")
+
+        if len(misses) > 1 and OCR_MAX_WORKERS > 1:
+            workers = min(OCR_MAX_WORKERS, len(misses))
+            logger.info(f"OCR processing {len(misses)} pages with {workers} workers...")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                ocr_texts = list(executor.map(_ocr_one, [images[i] for i in misses]))
+        else:
+            ocr_texts = [_ocr_one(images[i]) for i in misses]
+
+        for i, text in zip(misses, ocr_texts):
+            results[i] = text
+            _ocr_cache_put(keys[i], text)
+
+        return [text for text in results if text and text.strip()]
+
     def _extract_text_using_ocr(self, file_path: str) -> str:
         """Extract text from image-based PDF using OCR."""
         if not self._check_ocr_available():
@@ -253,49 +689,25 @@ class PDFReader:
             return ""
         
         try:
-            import pytesseract
+            import tempfile
             from pdf2image import convert_from_path
             logger.info("Starting OCR process for scanned PDF...")
-            
-            images = convert_from_path(file_path)
-            
-            text_pages = []
-            for page_num, image in enumerate(images, start=1):
-                logger.info(f"Processing page {page_num} with OCR...")
-                text = pytesseract.image_to_string(image, lang='eng')
-                if text and text.strip():
-                    text_pages.append(text)
-            
-            if text_pages:
-                full_text = '\n'.join(text_pages)
-                logger.info(f"OCR extracted text from {len(text_pages)} pages")
-                return full_text
-            
-            return ""
-        except Exception as e:
-            logger.error(f"OCR failed: {str(e)}")
-            return ""
-    
-    def _extract_text_using_ocr_from_bytes(self, file_content: bytes) -> str:
-        """Extract text from image-based PDF (bytes) using OCR."""
-        if not self._check_ocr_available():
-            logger.warning("OCR not available, cannot process scanned PDF")
-            return ""
-        
-        try:
-            import pytesseract
-            from pdf2image import convert_from_bytes
-            logger.info("Starting OCR process for scanned PDF (from bytes)...")
-            
-            images = convert_from_bytes(file_content)
-            
-            text_pages = []
-            for page_num, image in enumerate(images, start=1):
-                logger.info(f"Processing page {page_num} with OCR...")
-                text = pytesseract.image_to_string(image, lang='eng')
-                if text and text.strip():
-                    text_pages.append(text)
-            
+
+            # Render pages to files in a temp dir instead of holding
+            # every PIL image in RAM at once - peak memory stays at one
+            # page regardless of document size. TIFF also OCRs cleaner
+            # than pdf2image's default ppm.
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                images = convert_from_path(
+                    file_path,
+                    dpi=OCR_DPI,
+                    output_folder=tmp_dir,
+                    paths_only=True,
+                    thread_count=os.cpu_count() or 1,
+                    fmt='tiff'
+                )
+                text_pages = self._ocr_images(images)
+
             if text_pages:
                 full_text = '\n'.join(text_pages)
                 logger.info(f"OCR extracted text from {len(text_pages)} pages")
@@ -310,12 +722,18 @@ class PDFReader:
         """Remove extra whitespace from text."""
         if not text:
             return ""
-        
-        text = re.sub(r' +', ' ', text)
-        text = re.sub(r'\n+', '\n', text)
-        lines = [line.strip() for line in text.split('\n')]
-        lines = [line for line in lines if line]
-        return '\n'.join(lines)
+        text = text.translate(_WS_TRANS)
+        # Fast path: text with no space runs and no newlines (typical
+        # for already-clean page fragments) needs no per-line work at all
+        if '  ' not in text and '\n' not in text:
+            return text.strip()
+        # One C-level pass per line: no-arg split() collapses every
+        # whitespace run and drops empties, replacing the old regex
+        # substitutions (each a full extra traversal plus intermediate
+        # string) with plain split/join
+        return '\n'.join(
+            ' '.join(line.split()) for line in text.splitlines() if not line.isspace() and line
+        )
     
     def extract_page_text(self, file_path: str, page_num: int) -> str:
         """Extract text from a specific page."""
@@ -325,34 +743,51 @@ class PDFReader:
             raise PDFReadError("PDF processing library not available")
         
         try:
+            held = self._held_doc(file_path)
+            if held is not None:
+                return self._extract_single_page(held, page_num)
             with pdfplumber.open(file_path) as pdf:
-                if page_num < 1 or page_num > len(pdf.pages):
-                    raise PDFReadError(f"Page {page_num} does not exist. PDF has {len(pdf.pages)} pages.")
-                
-                page = pdf.pages[page_num - 1]
-                text = page.extract_text()
-                
-                if not text or not text.strip():
-                    raise PDFNoTextError(f"Page {page_num} contains no text.")
-                
-                return self._clean_text(text)
-                
+                return self._extract_single_page(pdf, page_num)
+
         except (PDFReadError, PDFNoTextError):
             raise
         except Exception as e:
             logger.exception(f"Error extracting page text: {str(e)}")
             raise PDFReadError(f"Failed to extract page text: {str(e)}")
-    
+
+    def _extract_single_page(self, pdf, page_num: int) -> str:
+        """Extract and clean one page from an opened document."""
+        if page_num < 1 or page_num > len(pdf.pages):
+            raise PDFReadError(f"Page {page_num} does not exist. PDF has {len(pdf.pages)} pages.")
+
+        page = pdf.pages[page_num - 1]
+        text = page.extract_text()
+
+        if not text or not text.strip():
+            raise PDFNoTextError(f"Page {page_num} contains no text.")
+
+        return self._clean_text(text)
+
     def get_page_count(self, file_path: str) -> int:
         """Get the number of pages in a PDF."""
         try:
             import pdfplumber
-            
+
+            held = self._held_doc(file_path)
+            if held is not None:
+                return len(held.pages)
+
+            key = (str(file_path), os.stat(file_path).st_mtime_ns)
+            cached = self._pagecount_cache.get(key)
+            if cached is not None:
+                return cached
+
             with pdfplumber.open(file_path) as pdf:
                 page_count = len(pdf.pages)
                 logger.info(f"PDF has {page_count} pages")
+                self._pagecount_cache[key] = page_count
                 return page_count
-                
+
         except Exception as e:
             logger.error(f"Error getting page count: {str(e)}")
             return 0
@@ -361,21 +796,39 @@ class PDFReader:
         """Check if PDF is scanned (image-based)."""
         try:
             import pdfplumber
-            
+
+            held = self._held_doc(file_path)
+            if held is not None:
+                return self._sample_is_scanned(held)
+
             with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages[:3]:
-                    if page.extract_text() and page.extract_text().strip():
-                        return False
-                
-                for page in pdf.pages[:3]:
-                    if page.images:
-                        return True
-                
-                return True
-                
+                return self._sample_is_scanned(pdf)
+
         except Exception as e:
             logger.error(f"Error checking if PDF is scanned: {str(e)}")
             return True
+
+    def _sample_is_scanned(self, pdf) -> bool:
+        """
+        Decide scanned-ness from the first sample_pages pages only -
+        detection never needs the whole document. Stops at the first
+        page with a real amount of text; a handful of stray characters
+        (page numbers, OCR artifacts) across the sample still counts
+        as scanned.
+        """
+        sampled = 0
+        total_chars = 0
+        for page in pdf.pages[:self.sample_pages]:
+            sampled += 1
+            try:
+                chars = len(_page_text(page).strip())
+            finally:
+                page.flush_cache()
+            if chars >= SCANNED_TEXT_THRESHOLD:
+                return False
+            total_chars += chars
+
+        return total_chars < SCANNED_TEXT_THRESHOLD * max(sampled, 1)
     
     def read_pdf_from_storage(self, file_id: str) -> Tuple[str, int]:
         """Read a stored PDF by file_id and extract text."""
@@ -393,7 +846,30 @@ class PDFReader:
             logger.error(f"PDF file not found on disk: {file_path}")
             raise PDFReadError(f"PDF file not found on disk: {file_path}")
         
-        page_count = self.get_page_count(str(file_path))
-        text = self.read_pdf(str(file_path))
-        
-        return text, page_count
+        try:
+            import pdfplumber
+        except ImportError:
+            logger.error("pdfplumber is not installed")
+            raise PDFReadError("PDF processing library not available. Please install pdfplumber: pip install pdfplumber")
+
+        # Serve repeated extractions of the same stored file from the
+        # text cache (keyed by path+mtime+size, so overwrites miss)
+        cache_key = _text_cache_key(file_path)
+        cached = _text_cache_get(cache_key)
+        if cached is not None and cached[1] is not None:
+            logger.info(f"Text cache hit for stored PDF: {file_id}")
+            return cached
+
+        # One pdfplumber.open serves both the page count and the text
+        # extraction - parsing the same PDF twice doubled read time here
+        try:
+            with pdfplumber.open(str(file_path)) as pdf:
+                page_count = len(pdf.pages)
+                text = self._read_open_pdf(pdf, str(file_path))
+            _text_cache_put(cache_key, text, page_count)
+            return text, page_count
+        except (PDFReadError, PDFNoTextError, FileNotFoundError):
+            raise
+        except Exception as e:
+            logger.exception(f"Error reading PDF: {str(e)}")
+            raise PDFReadError(f"Failed to read PDF: {str(e)}")
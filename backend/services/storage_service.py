@@ -2,6 +2,7 @@
 Storage Service - handles file storage operations.
 """
 import logging
+import os
 from pathlib import Path
 from typing import List
 from werkzeug.datastructures import FileStorage
@@ -12,12 +13,20 @@ logger = logging.getLogger(__name__)
 
 class StorageService:
     """Handles file storage operations for uploads and downloads."""
-    
+
+    # Folders already created by some instance - saves a mkdir (a stat
+    # syscall at best) per save call on the hot path
+    _dirs_created = set()
+
     def __init__(self):
         """Initialize storage service."""
         from backend.config import Config
         self.upload_folder = Config.UPLOAD_FOLDER
         self.json_folder = Config.JSON_OUTPUT_FOLDER
+        for folder in (self.upload_folder, self.json_folder):
+            if folder not in self._dirs_created:
+                folder.mkdir(parents=True, exist_ok=True)
+                self._dirs_created.add(folder)
         logger.info("Storage Service initialized")
     
     def save_upload(self, file: FileStorage, filename: str) -> Path:
@@ -32,12 +41,10 @@ class StorageService:
             Path to saved file
         """
         try:
-            # Ensure directory exists
-            self.upload_folder.mkdir(parents=True, exist_ok=True)
-            
-            # Save file
+            # Save file. A 1MB copy buffer streams the upload to disk in
+            # large sequential writes instead of Werkzeug's 16KB default.
             file_path = self.upload_folder / filename
-            file.save(str(file_path))
+            file.save(str(file_path), buffer_size=1024 * 1024)
             
             logger.info(f"File saved: {file_path}")
             return file_path
@@ -58,14 +65,11 @@ class StorageService:
             Path to saved file
         """
         try:
-            # Ensure directory exists
-            self.json_folder.mkdir(parents=True, exist_ok=True)
-            
-            # Save file
+            # Encode once and write the bytes directly - skips the
+            # text-mode buffering layer on multi-MB payloads
             file_path = self.json_folder / filename
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
+            file_path.write_bytes(content.encode('utf-8'))
+
             logger.info(f"JSON saved: {file_path}")
             return file_path
             
@@ -85,17 +89,13 @@ class StorageService:
             Path to saved file
         """
         try:
-            # Ensure directory exists
-            self.json_folder.mkdir(parents=True, exist_ok=True)
-            
             # Create filename with .json extension
             filename = f"{file_id}.json"
             file_path = self.json_folder / filename
-            
-            # Save file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
+
+            # Encode once and write the bytes directly
+            file_path.write_bytes(content.encode('utf-8'))
+
             logger.info(f"JSON saved with UUID: {file_path}")
             return file_path
             
@@ -125,6 +125,71 @@ class StorageService:
                 return None
         return None
     
+    def save_task_status(self, content: str, task_id: str) -> Path:
+        """
+        Persist a background task's status snapshot.
+
+        Written as <task_id>.task next to the JSON results so every
+        gunicorn worker can answer status polls, whichever process ran
+        the task. The .task suffix keeps them out of list_json_files.
+
+        Args:
+            content: Status snapshot as a JSON string
+            task_id: ID of the background task
+
+        Returns:
+            Path to saved file
+        """
+        try:
+            file_path = self.json_folder / f"{task_id}.task"
+            file_path.write_bytes(content.encode('utf-8'))
+            logger.debug(f"Task status saved: {file_path}")
+            return file_path
+
+        except Exception as e:
+            logger.error(f"Error saving task status: {e}")
+            raise
+
+    def get_task_status(self, task_id: str) -> str:
+        """
+        Get a background task's persisted status snapshot.
+
+        Args:
+            task_id: ID of the background task
+
+        Returns:
+            Status snapshot as JSON string, or None if not found
+        """
+        file_path = self.json_folder / f"{task_id}.task"
+
+        if file_path.exists():
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    return f.read()
+            except Exception as e:
+                logger.error(f"Error reading task status file: {e}")
+                return None
+        return None
+
+    def prune_task_statuses(self, max_age_seconds: int = 3600):
+        """
+        Delete task status files older than max_age_seconds.
+
+        Called when a new task is queued so finished tasks' snapshots
+        don't accumulate forever; an hour leaves ample polling time.
+        """
+        import time
+        cutoff = time.time() - max_age_seconds
+        try:
+            with os.scandir(self.json_folder) as entries:
+                for entry in entries:
+                    if entry.name[-5:] == '.task' and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error pruning task statuses: {e}")
+
     def get_pdf_path(self, filename: str) -> Path:
         """Get path to PDF file."""
         return self.upload_folder / filename
@@ -135,20 +200,25 @@ class StorageService:
     
     def list_pdf_files(self) -> List[str]:
         """List all PDF files in upload folder."""
+        # os.scandir hands back plain names without building Path
+        # objects per entry; a missing folder surfaces as
+        # FileNotFoundError instead of a separate exists() check
         try:
-            if not self.upload_folder.exists():
-                return []
-            return [f.name for f in self.upload_folder.iterdir() if f.suffix.lower() == '.pdf']
+            with os.scandir(self.upload_folder) as entries:
+                return [e.name for e in entries if e.name[-4:].lower() == '.pdf']
+        except FileNotFoundError:
+            return []
         except Exception as e:
             logger.error(f"Error listing PDF files: {e}")
             return []
-    
+
     def list_json_files(self) -> List[str]:
         """List all JSON files in output folder."""
         try:
-            if not self.json_folder.exists():
-                return []
-            return [f.name for f in self.json_folder.iterdir() if f.suffix.lower() == '.json']
+            with os.scandir(self.json_folder) as entries:
+                return [e.name for e in entries if e.name[-5:].lower() == '.json']
+        except FileNotFoundError:
+            return []
         except Exception as e:
             logger.error(f"Error listing JSON files: {e}")
             return []
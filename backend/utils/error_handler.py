@@ -3,6 +3,7 @@ Global error handler for the Flask application.
 Provides structured error responses and logging.
 """
 import logging
+import re
 from flask import jsonify
 from werkzeug.exceptions import HTTPException
 from typing import Tuple, Dict, Any
@@ -10,6 +11,65 @@ from typing import Tuple, Dict, Any
 # Create logger
 logger = logging.getLogger(__name__)
 
+_RATE_LIMIT_WAIT_RE = re.compile(r'Please try again in ([\d.]+)s')
+
+DEFAULT_SUGGESTION = "Please try again or contact support if the problem persists."
+
+
+def _rate_limit_suggestion(message: str) -> str:
+    """Build the rate-limit suggestion, including the wait time if the
+    API reported one."""
+    match = _RATE_LIMIT_WAIT_RE.search(message)
+    if match:
+        wait_seconds = float(match.group(1))
+        if wait_seconds >= 60:
+            minutes = int(wait_seconds / 60)
+            return f"GROQ API quota exceeded. Try again after {minutes} minutes or create new API key from https://console.groq.com/keys"
+        else:
+            return f"GROQ API quota exceeded. Wait {int(wait_seconds)} seconds or create new API key from https://console.groq.com/keys"
+    return "GROQ API quota exceeded. Create new API key from https://console.groq.com/keys"
+
+
+# Message-keyed suggestion dispatch, compiled once at import. Each entry
+# is (pattern, suggestion) where the suggestion may be a callable taking
+# the message; the first matching pattern wins, mirroring the old
+# if/elif order without re-scanning the message per branch.
+_SUGGESTION_TABLE = (
+    (re.compile(r'rate limit|429', re.I), _rate_limit_suggestion),
+    (re.compile(r'no text found|scanned', re.I),
+     "Try using a text-based PDF or install OCR dependencies: pip install pytesseract pdf2image"),
+    (re.compile(r'(?=.*pdf)(?=.*(?:not found|invalid))', re.I | re.S),
+     "Please upload a valid PDF file. The file may be corrupted or password protected."),
+    (re.compile(r'(?=.*api)(?=.*key)', re.I | re.S),
+     "Please check your GROQ_API_KEY in the .env file."),
+    (re.compile(r'database|db', re.I),
+     "Please restart the server to initialize the database."),
+    (re.compile(r'connection|network', re.I),
+     "Please check your internet connection and try again."),
+)
+
+# Same dispatch style for unhandled exceptions
+_GENERIC_SUGGESTION_TABLE = (
+    (re.compile(r'pdf', re.I),
+     "The PDF file may be corrupted or in an unsupported format."),
+    (re.compile(r'ocr|tesseract', re.I),
+     "OCR is not available. Install dependencies: pip install pytesseract pdf2image"),
+    (re.compile(r'(?=.*api)(?=.*(?:key|quota))', re.I | re.S),
+     "Check your API key in .env file or try again later."),
+    (re.compile(r'database|sqlite', re.I),
+     "Database error. Please restart the server."),
+    (re.compile(r'memory', re.I),
+     "File is too large or system memory is low. Try with a smaller PDF."),
+)
+
+
+def _lookup_suggestion(table, message: str, default: str) -> str:
+    """Return the suggestion for the first pattern matching the message."""
+    for pattern, suggestion in table:
+        if pattern.search(message):
+            return suggestion(message) if callable(suggestion) else suggestion
+    return default
+
 
 class APIError(Exception):
     """Base custom exception for API errors."""
@@ -39,32 +99,7 @@ class APIError(Exception):
     
     def _get_suggestion(self) -> str:
         """Get helpful suggestion based on error message."""
-        msg_lower = self.message.lower()
-        
-        if 'rate limit' in msg_lower or '429' in msg_lower:
-            # Try to extract reset time from error message
-            import re
-            match = re.search(r'Please try again in ([\d.]+)s', self.message)
-            if match:
-                wait_seconds = float(match.group(1))
-                if wait_seconds >= 60:
-                    minutes = int(wait_seconds / 60)
-                    return f"GROQ API quota exceeded. Try again after {minutes} minutes or create new API key from https://console.groq.com/keys"
-                else:
-                    return f"GROQ API quota exceeded. Wait {int(wait_seconds)} seconds or create new API key from https://console.groq.com/keys"
-            return "GROQ API quota exceeded. Create new API key from https://console.groq.com/keys"
-        elif 'no text found' in msg_lower or 'scanned' in msg_lower:
-            return "Try using a text-based PDF or install OCR dependencies: pip install pytesseract pdf2image"
-        elif 'pdf' in msg_lower and ('not found' in msg_lower or 'invalid' in msg_lower):
-            return "Please upload a valid PDF file. The file may be corrupted or password protected."
-        elif 'api' in msg_lower and 'key' in msg_lower:
-            return "Please check your GROQ_API_KEY in the .env file."
-        elif 'database' in msg_lower or 'db' in msg_lower:
-            return "Please restart the server to initialize the database."
-        elif 'connection' in msg_lower or 'network' in msg_lower:
-            return "Please check your internet connection and try again."
-        else:
-            return "Please try again or contact support if the problem persists."
+        return _lookup_suggestion(_SUGGESTION_TABLE, self.message, DEFAULT_SUGGESTION)
 
 
 class ValidationError(APIError):
@@ -166,20 +201,8 @@ def handle_generic_exception(error: Exception) -> Tuple[Dict[str, Any], int]:
     logger.exception(f"Unhandled exception: {str(error)}")
     
     # Check for specific common errors
-    error_msg = str(error).lower()
-    suggestion = "Please try again or contact support if the problem persists."
-    
-    if 'pdf' in error_msg:
-        suggestion = "The PDF file may be corrupted or in an unsupported format."
-    elif 'ocr' in error_msg or 'tesseract' in error_msg:
-        suggestion = "OCR is not available. Install dependencies: pip install pytesseract pdf2image"
-    elif 'api' in error_msg and ('key' in error_msg or 'quota' in error_msg):
-        suggestion = "Check your API key in .env file or try again later."
-    elif 'database' in error_msg or 'sqlite' in error_msg:
-        suggestion = "Database error. Please restart the server."
-    elif 'memory' in error_msg or 'memoryerror' in error_msg:
-        suggestion = "File is too large or system memory is low. Try with a smaller PDF."
-    
+    suggestion = _lookup_suggestion(_GENERIC_SUGGESTION_TABLE, str(error), DEFAULT_SUGGESTION)
+
     response = jsonify({
         'error': 'An unexpected error occurred. Please try again.',
         'status_code': 500,
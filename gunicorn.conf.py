@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for production deploys.
+
+Run with: gunicorn -c gunicorn.conf.py backend.app:app
+"""
+import os
+
+# Fork workers after create_app() has run so the DB engine, imports and
+# route table are shared copy-on-write instead of being rebuilt N times.
+preload_app = True
+
+# The extract/download endpoints spend most of their time waiting on disk
+# or the GROQ API, so threaded workers multiply concurrency without extra
+# processes.
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+workers = int(os.getenv('WEB_CONCURRENCY', 3))
+
+bind = f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('FLASK_PORT', 5000)}"
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 120))
+
+
+def post_fork(server, worker):
+    """Drop inherited DB connections so each worker opens its own."""
+    from backend.models import database
+    if database.engine is not None:
+        database.engine.dispose()
@@ -21,9 +21,26 @@ if __name__ == '__main__':
     host = os.getenv('FLASK_HOST', '0.0.0.0')
     port = int(os.getenv('FLASK_PORT', 5000))
     debug = app.config.get('FLASK_DEBUG', False)
-    
+
     print(f"Starting MCQ Extractor AI on {host}:{port}")
     print(f"Environment: {env}")
     print(f"Debug mode: {debug}")
-    
-    app.run(host=host, port=port, debug=debug)
+
+    if env == 'production':
+        # Never serve production traffic from Flask's dev server - it
+        # funnels every request through one Python loop. Hand off to
+        # gunicorn (multi-worker, threaded - see gunicorn.conf.py), which
+        # replaces this process; fall back to app.run only if gunicorn
+        # isn't installed.
+        try:
+            os.execvp('gunicorn', [
+                'gunicorn', '-c', 'gunicorn.conf.py', 'backend.app:app'
+            ])
+        except OSError:
+            print("WARNING: gunicorn not found, falling back to the "
+                  "single-process development server")
+
+    # The download/extract endpoints are dominated by disk I/O and outbound
+    # API calls, so handle each request in its own thread instead of
+    # serializing them on a single worker.
+    app.run(host=host, port=port, debug=debug, threaded=True)
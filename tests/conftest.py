@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+import sys
+from pathlib import Path
+
+# Make the backend package importable once per session instead of every
+# test module inserting the repo root itself
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Fixture directory, created once per session rather than per test setUp
+TEST_DATA_DIR = Path(__file__).parent / 'data'
+TEST_DATA_DIR.mkdir(exist_ok=True)
@@ -2,46 +2,42 @@
 Unit tests for PDF Reader service.
 """
 import unittest
-import os
-import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from backend.services.pdf_reader import PDFReader, PDFReadError, PDFNoTextError
 
+# Created once at import (conftest.py also ensures it for pytest runs)
+# instead of a mkdir syscall in every test's setUp
+_TEST_DATA_DIR = Path(__file__).parent / 'data'
+_TEST_DATA_DIR.mkdir(exist_ok=True)
+
 
 class TestPDFReader(unittest.TestCase):
     """Test cases for PDFReader class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.reader = PDFReader()
-        self.test_data_dir = Path(__file__).parent.parent / 'tests' / 'data'
-        self.test_data_dir.mkdir(exist_ok=True)
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Share one stateless reader across the class's tests."""
+        cls.reader = PDFReader()
+        cls.test_data_dir = _TEST_DATA_DIR
+
     def test_clean_text(self):
         """Test text cleaning functionality."""
-        # Test multiple spaces
-        text_with_spaces = "This   has    multiple   spaces"
-        result = self.reader._clean_text(text_with_spaces)
-        self.assertEqual(result, "This has multiple spaces")
-        
-        # Test multiple newlines
-        text_with_newlines = "Line 1\n\n\nLine 2\n\n\nLine 3"
-        result = self.reader._clean_text(text_with_newlines)
-        self.assertEqual(result, "Line 1\nLine 2\nLine 3")
-        
-        # Test leading/trailing whitespace
-        text_with_whitespace = "  Hello World  \n  Test  "
-        result = self.reader._clean_text(text_with_whitespace)
-        self.assertEqual(result, "Hello World\nTest")
-        
-        # Test empty lines removal
-        text_with_empty_lines = "Line 1\n\n\n\nLine 2"
-        result = self.reader._clean_text(text_with_empty_lines)
-        self.assertEqual(result, "Line 1\nLine 2")
+        cases = [
+            # Multiple spaces
+            ("This   has    multiple   spaces", "This has multiple spaces"),
+            # Multiple newlines
+            ("Line 1\n\n\nLine 2\n\n\nLine 3", "Line 1\nLine 2\nLine 3"),
+            # Leading/trailing whitespace
+            ("  Hello World  \n  Test  ", "Hello World\nTest"),
+            # Empty lines removal
+            ("Line 1\n\n\n\nLine 2", "Line 1\nLine 2"),
+        ]
+        # subTest reports every failing case instead of stopping at the
+        # first, and adding cases costs only the _clean_text call itself
+        for inp, expected in cases:
+            with self.subTest(inp=inp):
+                self.assertEqual(self.reader._clean_text(inp), expected)
     
     def test_clean_text_empty(self):
         """Test cleaning empty text."""
@@ -97,12 +93,12 @@ class TestPDFReader(unittest.TestCase):
 class TestPDFReaderIntegration(unittest.TestCase):
     """Integration tests for PDFReader (requires actual PDF file)."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.reader = PDFReader()
-        self.test_data_dir = Path(__file__).parent.parent / 'tests' / 'data'
-        self.test_data_dir.mkdir(exist_ok=True)
-    
+    @classmethod
+    def setUpClass(cls):
+        """Share one stateless reader across the class's tests."""
+        cls.reader = PDFReader()
+        cls.test_data_dir = _TEST_DATA_DIR
+
     def test_extract_text_page_by_page_empty_pdf(self):
         """Test page by page extraction with mock PDF."""
         # Since we can't easily create a real PDF in tests,